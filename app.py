@@ -3,28 +3,16 @@
 import streamlit as st
 
 from constants import OPTIONS
-from sidebar import get_selected_option
-from data_loader import load_main_csv, load_upcoming_csv
-from parsers import (
-    parse_followers,
-    parse_price,
-    parse_rating,
-    parse_discount,
-    parse_peak,
-    parse_release_date,
-)
-from charts import (
-    display_discount_analysis,
-    display_price_vs_gain,
-    display_segmentation,
-    display_discount_rescue,
-    display_value_analysis,
-    display_over_under_rated,
-    display_unexpected_hits,
-    display_growth_potential,
-    display_heatmap_rating_price,
-    display_launch_efficiency,
+import perf
+from sidebar import (
+    get_selected_option, get_streaming_mode, get_incremental_mode, get_sql_backend, get_filters,
+    get_perf_panel, show_perf_panel, show_memory_panel,
 )
+from data_loader import dataset_path, load_database, load_versioned, memory_usage
+from sql_backend import row_count
+from filters import filter_index
+import precompute
+from registry import ANALYSES
 
 
 def main():
@@ -36,60 +24,89 @@ def main():
 
     # Sidebar selector
     selected = get_selected_option(OPTIONS)
+    streaming = get_streaming_mode()
+    incremental = get_incremental_mode()
+    sql = get_sql_backend()
+    timing = get_perf_panel()
     st.markdown(f"### 📊 Аналітика: {selected}")
 
-    # Load the appropriate CSV(s)
-    df_main = None
-    df_upcoming = None
-    if selected != "Неочікувані хіти з малим фоловом":
-        df_main = load_main_csv()
-    else:
-        df_upcoming = load_upcoming_csv()
-
-    # Dispatch to the right analysis
-    if selected == "Вплив знижки на приріст уваги":
-        if df_main is not None:
-            display_discount_analysis(df_main)
-
-    elif selected == "Ціна гри vs приріст уваги":
-        if df_main is not None:
-            display_price_vs_gain(df_main)
-
-    elif selected == "Сегментація за ціною та рейтингом":
-        if df_main is not None:
-            display_segmentation(df_main)
-
-    elif selected == "Чи рятує знижка погані ігри":
-        if df_main is not None:
-            display_discount_rescue(df_main)
-
-    elif selected == "Вигідність гри":
-        if df_main is not None:
-            display_value_analysis(df_main)
-
-    elif selected == "Переоцінені й недооцінені ігри":
-        if df_main is not None:
-            display_over_under_rated(df_main)
-
-    elif selected == "Неочікувані хіти з малим фоловом":
-        if df_upcoming is not None:
-            display_unexpected_hits(df_upcoming)
-
-    elif selected == "Потенціал зростання гри":
-        if df_main is not None:
-            display_growth_potential(df_main)
-
-    elif selected == "Нестандарт рейтинг + ціна vs онлайн":
-        if df_upcoming is not None:
-            display_heatmap_rating_price(df_upcoming)
-
-    elif selected == "Ефективність запуску гри":
-        if df_main is not None:
-            display_launch_efficiency(df_main)
-
-    else:
+    if selected not in ANALYSES:
         st.error("⚠️ Оберіть валідну аналітичну категорію.")
-
+        return
+
+    with perf.run(selected, enabled=timing, streaming=streaming, incremental=incremental, sql=sql):
+        run_analysis(selected, streaming, incremental, sql)
+
+    if timing:
+        show_perf_panel(perf.history_frame())
+        report = memory_usage(dataset_path(ANALYSES[selected].dataset))
+        if report is not None:
+            show_memory_panel(report)
+
+
+def run_analysis(selected: str, streaming: bool, incremental: bool = False, sql: bool = False):
+    analysis = ANALYSES[selected]
+    path = dataset_path(analysis.dataset)
+    if streaming and analysis.stream:
+        with perf.stage("compute"):
+            analysis.stream(path)
+        return
+    if sql and analysis.sql:
+        run_sql_analysis(analysis)
+        return
+
+    # The frame and the version it reflects come from one read; the filter index, the
+    # shared rankings and cube and the result key all follow from that pair
+    loaded = load(analysis, incremental)
+    if loaded is None:
+        return
+    full, version = loaded
+    index = filter_index(path, version, full)
+    filters = get_filters(index)
+    rows = index.select(filters)
+    # Only the columns the analysis declares, and only `rows` when a sidebar filter is active
+    df = full[[c for c in analysis.columns if c in full]]
+    if rows is not None:
+        df = df.iloc[rows]
+    params = analysis.controls(len(df)) if analysis.controls else analysis.defaults
+
+    key = precompute.result_key(analysis, path, version, params, filters)
+    result = precompute.results().get(key)
+    if result is precompute.MISSING:
+        # Filtered rows are ranked by the shared rankings too, restricted to `rows`
+        shared = precompute.shared(analysis, path, version, full, incremental, rows)
+        with perf.stage("compute"):
+            result = precompute.compute(analysis, df, params, shared)
+        # Filtered tables can hold most of the dataset; only small ones are kept
+        precompute.results().put(key, result, None if rows is None else precompute.MAX_FILTERED_RESULT_BYTES)
+        # Warm up the other analyses of this dataset for the next sidebar switch
+        precompute.start(analysis.dataset, path, version, full, incremental)
+    else:
+        with perf.stage("compute") as compute:
+            compute["cached"] = True
+
+    with perf.stage("render"):
+        analysis.render(result)
+
+
+def run_sql_analysis(analysis):
+    with perf.stage("load"):
+        db = load_database(analysis.dataset)
+    if db is None:
+        return
+    params = analysis.controls(row_count(db)) if analysis.controls else analysis.defaults
+    with perf.stage("compute"):
+        result = analysis.sql(db, **params)
+    with perf.stage("render"):
+        analysis.render(result)
+
+
+def load(analysis, incremental: bool = False):
+    # The whole dataset with its version (see load_versioned); shared, so not copied
+    with perf.stage("load") as stage:
+        loaded = load_versioned(analysis.dataset, incremental)
+        stage["rows"] = 0 if loaded is None else len(loaded[0])
+    return loaded
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,6 @@
+# benchmarks
+#
+# Synthetic SteamDB data and per-stage timings for every analysis:
+#
+#     python -m benchmarks.run --rows 10000 --output bench-10k.json
+#     python -m benchmarks.compare bench-before.json bench-after.json
@@ -0,0 +1,49 @@
+# benchmarks/compare.py
+#
+# Compare two result files written by benchmarks.run, stage by stage:
+#
+#     python -m benchmarks.compare bench-before.json bench-after.json
+
+import argparse
+import json
+import sys
+
+
+def stages(results: dict) -> dict[str, float]:
+    """Flatten a results file into {"main.load_s": 0.12, "compute_x.render_s": 0.3, ...}."""
+    flat = {}
+    for group in ("datasets", "analyses"):
+        for name, timings in results[group].items():
+            for key, value in timings.items():
+                if key.endswith("_s"):
+                    flat[f"{name}.{key}"] = value
+    return flat
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Compare two benchmark result files.")
+    parser.add_argument("before")
+    parser.add_argument("after")
+    args = parser.parse_args()
+
+    with open(args.before, encoding="utf-8") as f:
+        before = json.load(f)
+    with open(args.after, encoding="utf-8") as f:
+        after = json.load(f)
+    if before["meta"]["rows"] != after["meta"]["rows"]:
+        print(f"warning: row counts differ ({before['meta']['rows']} vs {after['meta']['rows']})", file=sys.stderr)
+
+    old, new = stages(before), stages(after)
+    print(f"{'stage':<45} {'before':>10} {'after':>10} {'speedup':>8}")
+    for stage in [*old, *(stage for stage in new if stage not in old)]:
+        a, b = old.get(stage), new.get(stage)
+        if a is None or b is None:
+            print(f"{stage:<45} {a if a is not None else '-':>10} {b if b is not None else '-':>10}")
+            continue
+        speedup = a / b if b else float("inf")
+        print(f"{stage:<45} {a:>9.3f}s {b:>9.3f}s {speedup:>7.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,190 @@
+# benchmarks/run.py
+#
+# Time load, parse, compact, compute and render separately for every analysis in registry.REGISTRY
+# on synthetic data, with Streamlit output stubbed out, and save the timings as JSON.
+#
+#     python -m benchmarks.run --rows 1m --output bench-1m.json
+
+import argparse
+import contextlib
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import warnings
+from datetime import datetime, timezone
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import pandas as pd
+import streamlit as st
+
+import charts
+import figures
+import streaming
+from compaction import compact
+from data_loader import normalize, read_raw_csv
+from registry import REGISTRY, Analysis
+from benchmarks.synthetic import SIZES, write_csv
+
+# Streamlit calls the analyses make; all become no-ops while benchmarking
+STUBBED_CALLS = ("dataframe", "subheader", "caption", "warning", "error", "image", "pyplot", "markdown")
+
+
+@contextlib.contextmanager
+def stubbed_streamlit():
+    """
+    Replace Streamlit output calls and the paged tables (charts.show_table, with their
+    sort and page widgets) with no-ops, make number inputs return their default, and
+    collect draw() callbacks from show_figure instead of rendering them.
+    Yields the list the draw callbacks are appended to.
+    """
+    draws = []
+    saved = {name: getattr(st, name) for name in (*STUBBED_CALLS, "number_input")}
+    saved_show = {module: module.show_figure for module in (charts, streaming)}
+    saved_table = charts.show_table
+    try:
+        for name in STUBBED_CALLS:
+            setattr(st, name, lambda *args, **kwargs: None)
+        st.number_input = lambda label, min_value=None, max_value=None, value=None, **kwargs: value
+        for module in saved_show:
+            module.show_figure = lambda analysis, draw, *data, **params: draws.append(draw)
+        charts.show_table = lambda table, data, *args, **kwargs: None
+        yield draws
+    finally:
+        for name, fn in saved.items():
+            setattr(st, name, fn)
+        for module, fn in saved_show.items():
+            module.show_figure = fn
+        charts.show_table = saved_table
+
+
+def timed(fn, *args, repeat: int = 1):
+    """Call fn(*args) `repeat` times; return (last result, best wall time in seconds)."""
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn(*args)
+        best = min(best, time.perf_counter() - start)
+    return result, best
+
+
+def bench_dataset(path: str, repeat: int) -> tuple[pd.DataFrame, dict]:
+    raw, load_s = timed(read_raw_csv, path, repeat=repeat)
+    df, parse_s = timed(normalize, raw, repeat=repeat)
+    # Analyses run on the compacted frame, as in the app's load path
+    df, compact_s = timed(compact, df, repeat=repeat)
+    return df, {
+        "rows": len(raw), "bytes": os.path.getsize(path), "load_s": load_s, "parse_s": parse_s, "compact_s": compact_s,
+    }
+
+
+def bench_analysis(analysis: Analysis, df: pd.DataFrame, repeat: int) -> dict:
+    projected = df[[c for c in analysis.columns if c in df]]
+    result, compute_s = timed(lambda: analysis.compute(projected, **analysis.defaults), repeat=repeat)
+    start = time.perf_counter()
+    with stubbed_streamlit() as draws:
+        analysis.render(result)
+    for draw in draws:
+        figures.rasterize(draw())
+    return {"compute_s": compute_s, "render_s": time.perf_counter() - start, "figures": len(draws)}
+
+
+def _git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(rows: int, repeat: int = 1, workdir: str | None = None, seed: int = 0) -> dict:
+    """
+    Generate main and upcoming CSVs of `rows` rows in `workdir` (a temporary directory
+    by default), then time every analysis. Returns the JSON-ready results.
+    """
+    with contextlib.ExitStack() as stack:
+        if workdir is None:
+            workdir = stack.enter_context(tempfile.TemporaryDirectory())
+        os.makedirs(workdir, exist_ok=True)
+        paths = {
+            "main": os.path.join(workdir, f"steamdb_{rows}.csv"),
+            "upcoming": os.path.join(workdir, f"steamdb_upcoming_{rows}.csv"),
+        }
+        for kind, path in paths.items():
+            if not os.path.exists(path):
+                write_csv(path, rows, seed=seed, upcoming=kind == "upcoming")
+
+        datasets, frames = {}, {}
+        for kind, path in paths.items():
+            frames[kind], datasets[kind] = bench_dataset(path, repeat)
+
+        analyses = {}
+        for analysis in REGISTRY:
+            analyses[analysis.compute.__name__] = {
+                "option": analysis.option,
+                "dataset": analysis.dataset,
+                **bench_analysis(analysis, frames[analysis.dataset], repeat),
+            }
+
+    return {
+        "meta": {
+            "rows": rows,
+            "repeat": repeat,
+            "seed": seed,
+            "commit": _git_commit(),
+            "python": platform.python_version(),
+            "pandas": pd.__version__,
+            "machine": platform.machine(),
+            "cpus": os.cpu_count(),
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        },
+        "datasets": datasets,
+        "analyses": analyses,
+    }
+
+
+def _rows(value: str) -> int:
+    return SIZES.get(value.lower()) or int(value.replace("_", ""))
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark every analysis on synthetic SteamDB data.")
+    parser.add_argument("--rows", type=_rows, default="10k", help=f"row count or one of {', '.join(SIZES)}")
+    parser.add_argument("--repeat", type=int, default=1, help="runs per stage; the best time is kept")
+    parser.add_argument("--workdir", help="keep generated CSVs here and reuse them across runs")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="JSON file to write (default: print to stdout)")
+    args = parser.parse_args()
+
+    # pandas/seaborn chatter from the analyses themselves is not what is being measured
+    warnings.filterwarnings("ignore", category=pd.errors.SettingWithCopyWarning)
+    warnings.filterwarnings("ignore", category=FutureWarning)
+
+    results = run(args.rows, repeat=args.repeat, workdir=args.workdir, seed=args.seed)
+    text = json.dumps(results, indent=2, ensure_ascii=False)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+    for kind, timings in results["datasets"].items():
+        print(
+            f"{kind:>10}  load {timings['load_s']:8.3f}s  parse {timings['parse_s']:8.3f}s"
+            f"  compact {timings['compact_s']:8.3f}s",
+            file=sys.stderr,
+        )
+    for name, timings in results["analyses"].items():
+        print(f"{name:>30}  compute {timings['compute_s']:8.3f}s  render {timings['render_s']:8.3f}s", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,81 @@
+# benchmarks/synthetic.py
+
+import numpy as np
+import pandas as pd
+
+# Row counts the benchmark suite is meant to be run at
+SIZES = {"10k": 10_000, "1m": 1_000_000, "10m": 10_000_000}
+
+# Release date strings as SteamDB prints them, plus the placeholders it uses
+# for games without a date
+DATE_FORMATS = ["%d %B %Y", "%d %b, %Y", "%B %Y", "%Y"]
+UNDATED = ["Coming soon", "To be announced", "Q3 2026"]
+
+
+def _thousands(values: np.ndarray, suffix: str = "") -> list[str]:
+    return [f"{v:,}{suffix}" for v in values.tolist()]
+
+
+def generate(rows: int, seed: int = 0, upcoming: bool = False, start: int = 0) -> pd.DataFrame:
+    """
+    Build `rows` synthetic rows with the scraper's column names and string formats:
+    followers like "1,234+", prices like "€19,99" or "Free", ratings like "85.12%",
+    discounts like "-20%", owners like "12,345" and SteamDB-style release dates.
+    A few percent of each column is missing or malformed, as in real exports.
+    `upcoming` skews dates to the future and leaves most games unrated.
+    `start` offsets game names so chunks of one file do not repeat them.
+    """
+    rng = np.random.default_rng(seed)
+
+    # Heavy-tailed gains: most games gain little, a few gain a lot
+    gains = np.minimum(rng.lognormal(5, 2, rows), 5_000_000).astype(np.int64)
+    followers = np.array(_thousands(gains, "+"), dtype=object)
+    plain = rng.random(rows) < 0.3
+    followers[plain] = gains[plain].astype(str)
+
+    cents = rng.choice([0, 99, 199, 499, 999, 1499, 1999, 2499, 2999, 3999, 4999, 5999, 6999], rows)
+    price = np.array([f"€{c // 100},{c % 100:02d}" for c in cents.tolist()], dtype=object)
+    price[cents == 0] = "Free"
+    discounted = rng.random(rows) < 0.25
+    percents = rng.choice([10, 15, 20, 25, 30, 33, 40, 50, 60, 75, 80, 90], rows)
+    discount = np.where(discounted, [f"-{p}%" for p in percents.tolist()], None).astype(object)
+    # Some scrapes carry the discount inside the price cell
+    in_price = discounted & (rng.random(rows) < 0.1)
+    price[in_price] = [f"{p} -{d}%" for p, d in zip(price[in_price], percents[in_price])]
+
+    rating = np.array([f"{r:.2f}%" for r in np.clip(rng.normal(72, 15, rows), 0, 100).tolist()], dtype=object)
+    rating[rng.random(rows) < (0.7 if upcoming else 0.05)] = None
+
+    owners = np.array(_thousands(np.minimum(rng.lognormal(6, 2.5, rows), 2_000_000).astype(np.int64)), dtype=object)
+
+    offset_days = rng.integers(-400, 60, rows) if upcoming else rng.integers(1, 6000, rows)
+    dates = pd.Timestamp("2026-01-01") - pd.to_timedelta(offset_days, unit="D")
+    fmt = rng.integers(0, len(DATE_FORMATS), rows)
+    release_date = np.array(
+        [d.strftime(DATE_FORMATS[f]).lstrip("0") for d, f in zip(dates, fmt.tolist())], dtype=object
+    )
+    undated = rng.random(rows) < (0.3 if upcoming else 0.02)
+    release_date[undated] = rng.choice(UNDATED, undated.sum())
+
+    for column in (followers, price, owners, release_date):
+        column[rng.random(rows) < 0.02] = None
+    followers[rng.random(rows) < 0.005] = "N/A"
+
+    return pd.DataFrame({
+        "name": [f"Game {i}" for i in range(start, start + rows)],
+        "followers": followers,
+        "price": price,
+        "rating": rating,
+        "discount": discount,
+        "owners": owners,
+        "release_date": release_date,
+    })
+
+
+def write_csv(path: str, rows: int, seed: int = 0, upcoming: bool = False, chunk_rows: int = 500_000):
+    """
+    Write a synthetic CSV of `rows` rows in chunks, so 10M-row files never sit in memory whole.
+    """
+    for index, start in enumerate(range(0, rows, chunk_rows)):
+        chunk = generate(min(chunk_rows, rows - start), seed=seed + index, upcoming=upcoming, start=start)
+        chunk.to_csv(path, mode="w" if index == 0 else "a", header=index == 0, index=False)
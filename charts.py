@@ -1,352 +1,543 @@
 # charts.py
+#
+# Each analysis is split into a pure compute_* step (DataFrame in, result out, no
+# Streamlit calls) and a render_* step that shows that result. display_* runs both.
+#
+# The frame a compute_* step gets is the dataset every session shares (see
+# data_loader.shared_dataset). Steps never assign into it or filter it as a whole:
+# they build masks and derived Series over its columns and take out only the rows
+# of their result (see ranking.top_k).
+#
+# Matplotlib, seaborn and statsmodels are imported inside the draw() callbacks:
+# they are only loaded once a chart is actually rendered (not on a figure cache hit),
+# which keeps them out of the app's cold start.
 
 import streamlit as st
 import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
-from statsmodels.nonparametric.smoothers_lowess import lowess
 
-from parsers import (
-    parse_followers,
-    parse_price,
-    parse_rating,
-    parse_discount,
-    parse_peak,
-    parse_release_date,
-)
+from figures import show_figure
+from tables import show_table
+from cube import PriceRatingCube
+from ranking import RankingStore, top_k, top_bottom_k
+from smoothing import binned_lowess
 
+# Exact LOWESS cost grows quadratically; above this many points the
+# price-vs-gain trend line uses binned_lowess instead
+LOWESS_MAX_POINTS = 2_000
+
+
+def uses_columns(*columns):
+    """
+    Declare which columns of the normalized dataset an analysis reads,
+    so the loader can project just those (exposed as `fn.columns`).
+    """
+    def decorate(fn):
+        fn.columns = columns
+        return fn
+    return decorate
+
+
+def uses_rankings(fn):
+    """
+    Declare that an analysis reads the shared rankings (see ranking_store): it takes a
+    `rankings` RankingStore of the frame, and builds its own if none is given
+    (exposed as `fn.ranked`).
+    """
+    fn.ranked = True
+    return fn
+
+
+def uses_cube(fn):
+    """
+    Declare that an analysis reads the shared price × rating cube (see
+    cube.PriceRatingCube): it takes a `cube` of the frame, and builds its own if none
+    is given (exposed as `fn.cubed`).
+    """
+    fn.cubed = True
+    return fn
+
+
+def _today(today: pd.Timestamp | None) -> pd.Timestamp:
+    return pd.to_datetime("today") if today is None else today
+
+
+def _wide(s: pd.Series) -> pd.Series:
+    # Ratios are computed in float64 whatever the column is stored as (see compaction),
+    # like the SQLite backend does
+    return s.astype(float)
+
+
+def known(df: pd.DataFrame, *columns: str) -> pd.Series:
+    """True for rows with a value in every one of `columns`."""
+    mask = df[columns[0]].notna()
+    for column in columns[1:]:
+        mask &= df[column].notna()
+    return mask
+
+
+def discount_mask(df: pd.DataFrame) -> pd.Series:
+    """True where either the discount or the price column shows a discount."""
+    return df["has_discount"] | df["discount_in_price"]
 
-def display_discount_analysis(df: pd.DataFrame):
-    df = df.dropna(subset=["followers"])
-    df["has_discount"] = df.apply(lambda row: parse_discount(row.get("discount", "")) or parse_discount(row.get("price", "")), axis=1)
-    df["followers_gain"] = df["followers"].apply(parse_followers)
 
+def discount_flags(df: pd.DataFrame) -> pd.DataFrame:
+    """Games with a follower gain, with has_discount set from either the discount or the price column."""
+    present = df["followers_gain"].notna()
+    return df[present].assign(has_discount=discount_mask(df)[present])
+
+
+def render_discount_tables(no_discount: pd.DataFrame, with_discount: pd.DataFrame):
     st.subheader("🎯 Ігри без знижки")
-    st.dataframe(
-        df[df["has_discount"] == False][
-            ["name", "followers_gain", "discount", "price"]
-        ].sort_values("followers_gain", ascending=False)
-    )
+    show_table("no_discount", no_discount)
 
     st.subheader("💸 Ігри зі знижкою")
-    st.dataframe(
-        df[df["has_discount"] == True][
-            ["name", "followers_gain", "discount", "price"]
-        ].sort_values("followers_gain", ascending=False)
-    )
+    show_table("with_discount", with_discount)
 
-    # Boxplot without extreme outliers
-    q99 = df["followers_gain"].quantile(0.99)
-    filtered = df[df["followers_gain"] < q99]
-
-    fig, ax = plt.subplots(figsize=(8, 5))
-    sns.boxplot(
-        data=filtered,
-        x="has_discount",
-        y="followers_gain",
-        ax=ax,
-        palette="autumn"
-    )
+
+def label_discount_boxplot(ax):
     ax.set_xlabel("Є знижка")
     ax.set_ylabel("Приріст фоловерів (7 днів)")
     ax.set_title("Залежність 7d Gain від наявності знижки")
     ax.set_ylim(0, 100_000)
     ax.set_xticklabels(["False", "True"])
-    st.pyplot(fig)
 
 
-def display_price_vs_gain(df: pd.DataFrame):
-    df = df.dropna(subset=["price", "followers"])
-    df["price_eur"] = df["price"].apply(parse_price)
-    df["followers_gain"] = df["followers"].apply(parse_followers)
-    df = df.dropna(subset=["price_eur", "followers_gain"])
-
-    df_top = df.sort_values("followers_gain", ascending=False).head(100)
-    st.subheader("📋 Дані для побудови графіка (топ 100)")
-    st.dataframe(
-        df_top[["name", "price", "price_eur", "followers_gain", "discount"]]
-        .reset_index(drop=True)
-    )
+@uses_rankings
+@uses_columns("name", "price", "discount", "followers_gain", "has_discount", "discount_in_price")
+def compute_discount_analysis(df: pd.DataFrame, rankings: RankingStore | None = None) -> dict:
+    rankings = rankings or ranking_store(df)
+    gain = df["followers_gain"]
+    discounted = discount_mask(df)
+    table = df[["name", "followers_gain", "discount", "price"]]
+
+    # Boxplot without extreme outliers
+    inside = gain < gain.quantile(0.99)
+    return {
+        "no_discount": rankings.top(table, "followers_gain", where=~discounted),
+        "with_discount": rankings.top(table, "followers_gain", where=discounted),
+        "boxplot": pd.DataFrame({"has_discount": discounted[inside], "followers_gain": gain[inside]}),
+    }
+
+
+def render_discount_analysis(result: dict):
+    render_discount_tables(result["no_discount"], result["with_discount"])
+    filtered = result["boxplot"]
+
+    def draw():
+        import matplotlib.pyplot as plt
+        import seaborn as sns
 
-    fig, ax = plt.subplots(figsize=(8, 5))
-    sns.scatterplot(
-        data=df_top,
-        x="price_eur",
-        y="followers_gain",
-        ax=ax,
-        s=30
+        fig, ax = plt.subplots(figsize=(8, 5))
+        sns.boxplot(
+            data=filtered,
+            x="has_discount",
+            y="followers_gain",
+            ax=ax,
+            palette="autumn"
+        )
+        label_discount_boxplot(ax)
+        return fig
+
+    show_figure("discount_analysis", draw, filtered)
+
+
+def display_discount_analysis(df: pd.DataFrame):
+    render_discount_analysis(compute_discount_analysis(df))
+
+
+def price_vs_gain_controls(rows: int) -> dict:
+    """Number input for how many of the top-gaining games (out of `rows`) the price-vs-gain chart covers."""
+    top_n = st.number_input(
+        "Кількість ігор з найбільшим приростом на графіку",
+        min_value=1,
+        max_value=max(rows, 1),
+        value=min(100, max(rows, 1)),
+        step=100,
     )
-    smooth = lowess(df_top["followers_gain"], df_top["price_eur"], frac=0.3)
-    ax.plot(smooth[:, 0], smooth[:, 1], color="black", linewidth=2)
-    ax.set_xlabel("Ціна гри (€)")
-    ax.set_ylabel("Приріст фоловерів")
-    ax.set_title("Ціна гри vs Приріст уваги (7d Gain)")
-    st.pyplot(fig)
+    return {"top_n": int(top_n)}
 
 
-def display_segmentation(df: pd.DataFrame):
-    df = df.dropna(subset=["price", "followers", "rating"])
-    df["price_eur"] = df["price"].apply(parse_price)
-    df["followers_gain"] = df["followers"].apply(parse_followers)
-    df["rating_pct"] = df["rating"].apply(parse_rating)
-    df = df.dropna(subset=["price_eur", "followers_gain", "rating_pct"])
+@uses_rankings
+@uses_columns("name", "price", "discount", "price_eur", "followers_gain")
+def compute_price_vs_gain(df: pd.DataFrame, top_n: int = 100, rankings: RankingStore | None = None) -> pd.DataFrame:
+    rankings = rankings or ranking_store(df)
+    table = df[["name", "price", "price_eur", "followers_gain", "discount"]]
+    return rankings.top(table, "followers_gain", top_n, where=known(df, "price", "price_eur"))
+
+
+def render_price_vs_gain(df_top: pd.DataFrame):
+    if df_top.empty:
+        st.warning("⚠️ Недостатньо даних для побудови графіка.")
+        return
+
+    st.subheader("📋 Дані для побудови графіка")
+    show_table("price_vs_gain", df_top)
+
+    def draw():
+        import matplotlib.pyplot as plt
+        import seaborn as sns
+
+        fig, ax = plt.subplots(figsize=(8, 5))
+        sns.scatterplot(
+            data=df_top,
+            x="price_eur",
+            y="followers_gain",
+            ax=ax,
+            s=30
+        )
+        if len(df_top) <= LOWESS_MAX_POINTS:
+            from statsmodels.nonparametric.smoothers_lowess import lowess
+            smooth = lowess(df_top["followers_gain"], df_top["price_eur"], frac=0.3)
+        else:
+            smooth = binned_lowess(df_top["price_eur"], df_top["followers_gain"], frac=0.3)
+        ax.plot(smooth[:, 0], smooth[:, 1], color="black", linewidth=2)
+        ax.set_xlabel("Ціна гри (€)")
+        ax.set_ylabel("Приріст фоловерів")
+        ax.set_title("Ціна гри vs Приріст уваги (7d Gain)")
+        return fig
+
+    show_figure("price_vs_gain", draw, df_top[["price_eur", "followers_gain"]])
+
+
+def display_price_vs_gain(df: pd.DataFrame):
+    render_price_vs_gain(compute_price_vs_gain(df, **price_vs_gain_controls(len(df))))
 
-    def price_cat(p):
-        if p < 15: return "Low"
-        if p <= 40: return "Mid"
-        return "High"
 
-    def rating_cat(r):
-        if r >= 80: return "Positive"
-        if r >= 50: return "Mixed"
-        return "Negative"
+@uses_cube
+@uses_columns("price", "rating", "price_eur", "followers_gain", "rating_pct")
+def compute_segmentation(df: pd.DataFrame, cube: PriceRatingCube | None = None) -> pd.Series:
+    cube = cube or PriceRatingCube.build(df)
+    return cube.means("followers_gain")
 
-    df["price_cat"] = df["price_eur"].apply(price_cat)
-    df["rating_cat"] = df["rating_pct"].apply(rating_cat)
 
+def render_segmentation(mean_gain: pd.Series):
     pivot = (
-        df.groupby(["price_cat", "rating_cat"])["followers_gain"]
-        .mean()
+        mean_gain
         .reset_index()
         .rename(columns={"followers_gain": "Середній 7d Gain", "price_cat": "Ціна", "rating_cat": "Рейтинг"})
     )
 
     st.subheader("📋 Числові значення")
-    st.dataframe(pivot.sort_values("Середній 7d Gain", ascending=False).reset_index(drop=True))
-
-    fig, ax = plt.subplots(figsize=(10, 5))
-    sns.barplot(
-        data=pivot,
-        x="Ціна",
-        y="Середній 7d Gain",
-        hue="Рейтинг",
-        ax=ax,
-        palette="autumn"
-    )
-    ax.set_title("Середній приріст уваги (7d Gain) по категоріях ціни та рейтингу")
-    st.pyplot(fig)
+    show_table("segmentation", pivot, sort="Середній 7d Gain")
 
+    def draw():
+        import matplotlib.pyplot as plt
+        import seaborn as sns
+
+        fig, ax = plt.subplots(figsize=(10, 5))
+        sns.barplot(
+            data=pivot,
+            x="Ціна",
+            y="Середній 7d Gain",
+            hue="Рейтинг",
+            ax=ax,
+            palette="autumn"
+        )
+        ax.set_title("Середній приріст уваги (7d Gain) по категоріях ціни та рейтингу")
+        return fig
+
+    show_figure("segmentation", draw, pivot)
+
+
+def display_segmentation(df: pd.DataFrame):
+    render_segmentation(compute_segmentation(df))
 
-def display_discount_rescue(df: pd.DataFrame):
-    df = df.dropna(subset=["followers", "rating"])
-    df["followers_gain"] = df["followers"].apply(parse_followers)
-    df["rating_pct"] = df["rating"].apply(parse_rating)
-    df["has_discount"] = df["discount"].apply(parse_discount)
-    df = df.dropna(subset=["followers_gain", "rating_pct"])
 
-    bad = df[df["rating_pct"] < 50]
-    top_bad = bad.sort_values("followers_gain", ascending=False).head(100)
+@uses_rankings
+@uses_columns("name", "rating", "discount", "followers_gain", "rating_pct", "has_discount")
+def compute_discount_rescue(df: pd.DataFrame, rankings: RankingStore | None = None) -> pd.DataFrame:
+    rankings = rankings or ranking_store(df)
+    bad = df["rating"].notna() & (df["rating_pct"] < 50)
+    return rankings.top(df, "followers_gain", 100, where=bad)
 
+
+def render_discount_rescue(top_bad: pd.DataFrame):
     st.subheader("📋 Дані для побудови графіка")
-    st.dataframe(
-        top_bad[["name", "followers_gain", "rating", "discount"]]
-        .reset_index(drop=True)
-    )
+    show_table("discount_rescue", top_bad[["name", "followers_gain", "rating", "discount"]])
+
+    def draw():
+        import matplotlib.pyplot as plt
+        import seaborn as sns
+
+        fig, ax = plt.subplots(figsize=(8, 5))
+        sns.boxplot(
+            data=top_bad,
+            x="has_discount",
+            y="followers_gain",
+            ax=ax,
+            palette="autumn"
+        )
+        ax.set_xlabel("Є знижка")
+        ax.set_ylabel("7d Gain")
+        ax.set_title("Знижка для ігор з поганим рейтингом")
+        ax.set_xticklabels(["False", "True"])
+        ax.set_ylim(0, 20_000)
+        return fig
+
+    show_figure("discount_rescue", draw, top_bad[["has_discount", "followers_gain"]])
 
-    fig, ax = plt.subplots(figsize=(8, 5))
-    sns.boxplot(
-        data=top_bad,
-        x="has_discount",
-        y="followers_gain",
-        ax=ax,
-        palette="autumn"
-    )
-    ax.set_xlabel("Є знижка")
-    ax.set_ylabel("7d Gain")
-    ax.set_title("Знижка для ігор з поганим рейтингом")
-    ax.set_xticklabels(["False", "True"])
-    ax.set_ylim(0, 20_000)
-    st.pyplot(fig)
 
+def display_discount_rescue(df: pd.DataFrame):
+    render_discount_rescue(compute_discount_rescue(df))
 
-def display_value_analysis(df: pd.DataFrame):
-    df = df.dropna(subset=["price", "followers"])
-    df["price_eur"] = df["price"].apply(parse_price)
-    df["followers_gain"] = df["followers"].apply(parse_followers)
-    df = df.dropna(subset=["price_eur", "followers_gain"])
-    df = df[df["price_eur"] > 0]
 
-    df["value_score"] = df["followers_gain"] / df["price_eur"]
-    top10 = df.sort_values("value_score", ascending=False).head(10)
+def value_score(df: pd.DataFrame) -> pd.Series:
+    """7d gain per euro of each paid game, NaN for the rest."""
+    paid = df["price"].notna() & (df["price_eur"] > 0)
+    return (_wide(df["followers_gain"]) / _wide(df["price_eur"])).where(paid).rename("value_score")
 
+
+def value_scores(df: pd.DataFrame) -> pd.DataFrame:
+    """Paid games with their 7d gain per euro (value_score)."""
+    score = value_score(df)
+    scored = score.notna()
+    return df[scored].assign(value_score=score[scored])
+
+
+@uses_columns("name", "price", "price_eur", "followers_gain")
+def compute_value_analysis(df: pd.DataFrame) -> pd.DataFrame:
+    return top_k(df, value_score(df), 10)
+
+
+def render_value_analysis(top10: pd.DataFrame):
     st.subheader("📋 Дані найвигідніших ігор")
-    st.dataframe(
-        top10[["name", "followers_gain", "price_eur", "value_score"]]
-        .reset_index(drop=True)
-    )
+    show_table("value_analysis", top10[["name", "followers_gain", "price_eur", "value_score"]])
 
-    fig, ax = plt.subplots(figsize=(8, 5))
-    sns.barplot(
-        data=top10,
-        y="name",
-        x="value_score",
-        ax=ax
-    )
-    ax.set_title("Топ-10 найвигідніших ігор (7d Gain / Price)")
-    ax.set_xlabel("Інтерес за 1 євро")
-    ax.set_ylabel("Назва гри")
-    st.pyplot(fig)
+    def draw():
+        import matplotlib.pyplot as plt
+        import seaborn as sns
 
+        fig, ax = plt.subplots(figsize=(8, 5))
+        sns.barplot(
+            data=top10,
+            y="name",
+            x="value_score",
+            ax=ax
+        )
+        ax.set_title("Топ-10 найвигідніших ігор (7d Gain / Price)")
+        ax.set_xlabel("Інтерес за 1 євро")
+        ax.set_ylabel("Назва гри")
+        return fig
 
-def display_over_under_rated(df: pd.DataFrame):
-    df = df.dropna(subset=["followers", "rating"])
-    df["followers_gain"] = df["followers"].apply(parse_followers)
-    df["rating_pct"] = df["rating"].apply(parse_rating)
-    df = df.dropna(subset=["followers_gain", "rating_pct"])
-    df = df[df["rating_pct"] > 0]
+    show_figure("value_analysis", draw, top10[["name", "value_score"]])
 
-    df["value_index"] = df["followers_gain"] / df["rating_pct"]
-    overrated = df.sort_values("value_index", ascending=True).head(5)
-    underrated = df.sort_values("value_index", ascending=False).head(5)
+
+def display_value_analysis(df: pd.DataFrame):
+    render_value_analysis(compute_value_analysis(df))
+
+
+@uses_columns("name", "rating", "followers_gain", "rating_pct")
+def compute_over_under_rated(df: pd.DataFrame) -> tuple[pd.DataFrame, pd.DataFrame]:
+    rated = df["rating"].notna() & (df["rating_pct"] > 0)
+    value_index = (_wide(df["followers_gain"]) / _wide(df["rating_pct"])).where(rated).rename("value_index")
+    return top_bottom_k(df, value_index, 5)
+
+
+def render_over_under_rated(result: tuple[pd.DataFrame, pd.DataFrame]):
+    overrated, underrated = result
 
     st.subheader("📋 Переоцінені ігри")
-    st.dataframe(
-        overrated[["name", "followers_gain", "rating_pct", "value_index"]]
-        .reset_index(drop=True)
-    )
+    show_table("overrated", overrated[["name", "followers_gain", "rating_pct", "value_index"]])
 
     st.subheader("📋 Недооцінені ігри")
-    st.dataframe(
-        underrated[["name", "followers_gain", "rating_pct", "value_index"]]
-        .reset_index(drop=True)
-    )
+    show_table("underrated", underrated[["name", "followers_gain", "rating_pct", "value_index"]])
 
-    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(12, 5))
-    sns.barplot(data=overrated, x="value_index", y="name", ax=ax1, palette="autumn")
-    ax1.set_title("Переоцінені ігри")
-    ax1.set_xlabel("value_index")
-    ax1.set_ylabel("Name")
+    def draw():
+        import matplotlib.pyplot as plt
+        import seaborn as sns
 
-    sns.barplot(data=underrated, x="value_index", y="name", ax=ax2, palette="spring")
-    ax2.set_title("Недооцінені ігри")
-    ax2.set_xlabel("value_index")
-    st.pyplot(fig)
+        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(12, 5))
+        sns.barplot(data=overrated, x="value_index", y="name", ax=ax1, palette="autumn")
+        ax1.set_title("Переоцінені ігри")
+        ax1.set_xlabel("value_index")
+        ax1.set_ylabel("Name")
 
+        sns.barplot(data=underrated, x="value_index", y="name", ax=ax2, palette="spring")
+        ax2.set_title("Недооцінені ігри")
+        ax2.set_xlabel("value_index")
+        return fig
 
-def display_unexpected_hits(df: pd.DataFrame):
-    df = df.dropna(subset=["price", "followers", "owners"])
-    df["price_eur"] = df["price"].apply(parse_price)
-    df["followers_num"] = df["followers"].apply(parse_followers)
-    df["peak_num"] = df["owners"].apply(parse_peak)
-    df = df.dropna(subset=["price_eur", "followers_num", "peak_num"])
-    df = df[(df["followers_num"] > 0) & (df["price_eur"] > 0)]
+    show_figure("over_under_rated", draw, overrated[["name", "value_index"]], underrated[["name", "value_index"]])
 
-    df["peak_ratio"] = df["peak_num"] / df["followers_num"]
-    top_under = df.sort_values("peak_ratio", ascending=False).head(5)
-    top_over = df.sort_values("peak_ratio", ascending=True).head(5)
 
-    st.subheader("📋 Переоцінені ігри")
-    st.dataframe(
-        top_over[["name", "followers_num", "peak_num", "peak_ratio"]]
-        .reset_index(drop=True)
+def display_over_under_rated(df: pd.DataFrame):
+    render_over_under_rated(compute_over_under_rated(df))
+
+
+@uses_columns("name", "price", "price_eur", "followers_gain", "peak")
+def compute_unexpected_hits(df: pd.DataFrame) -> tuple[pd.DataFrame, pd.DataFrame]:
+    eligible = df["price"].notna() & (df["followers_gain"] > 0) & (df["price_eur"] > 0)
+    peak_ratio = (_wide(df["peak"]) / _wide(df["followers_gain"])).where(eligible).rename("peak_ratio")
+    return tuple(
+        rows.assign(followers_num=rows["followers_gain"], peak_num=rows["peak"])
+        for rows in top_bottom_k(df, peak_ratio, 5)
     )
 
+
+def render_unexpected_hits(result: tuple[pd.DataFrame, pd.DataFrame]):
+    top_over, top_under = result
+
+    st.subheader("📋 Переоцінені ігри")
+    show_table("hits_over", top_over[["name", "followers_num", "peak_num", "peak_ratio"]])
+
     st.subheader("📋 Неочікувані хіти")
-    st.dataframe(
-        top_under[["name", "followers_num", "peak_num", "peak_ratio"]]
-        .reset_index(drop=True)
-    )
+    show_table("hits_under", top_under[["name", "followers_num", "peak_num", "peak_ratio"]])
 
-    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(12, 5))
-    sns.barplot(data=top_over, x="peak_ratio", y="name", ax=ax1)
-    ax1.set_title("Переоцінені ігри")
-    ax1.set_xlabel("Peak / Followers")
+    def draw():
+        import matplotlib.pyplot as plt
+        import seaborn as sns
 
-    sns.barplot(data=top_under, x="peak_ratio", y="name", ax=ax2)
-    ax2.set_title("Недооцінені ігри")
-    ax2.set_xlabel("Peak / Followers")
-    st.pyplot(fig)
+        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(12, 5))
+        sns.barplot(data=top_over, x="peak_ratio", y="name", ax=ax1)
+        ax1.set_title("Переоцінені ігри")
+        ax1.set_xlabel("Peak / Followers")
 
+        sns.barplot(data=top_under, x="peak_ratio", y="name", ax=ax2)
+        ax2.set_title("Недооцінені ігри")
+        ax2.set_xlabel("Peak / Followers")
+        return fig
+
+    show_figure("unexpected_hits", draw, top_over[["name", "peak_ratio"]], top_under[["name", "peak_ratio"]])
+
+
+def display_unexpected_hits(df: pd.DataFrame):
+    render_unexpected_hits(compute_unexpected_hits(df))
+
+
+@uses_rankings
+@uses_columns("name", "release_date", "followers_gain", "release_date_parsed")
+def compute_growth_potential(df: pd.DataFrame, today: pd.Timestamp | None = None,
+                             rankings: RankingStore | None = None) -> pd.DataFrame:
+    return top_launches(df, rankings or ranking_store(df, today))
 
-def display_growth_potential(df: pd.DataFrame):
-    df = df.dropna(subset=["followers", "release_date"])
-    today = pd.to_datetime("today")
-    df["followers_num"] = df["followers"].apply(parse_followers)
-    df["release_date_parsed"] = df["release_date"].apply(parse_release_date)
-    df["days_since_release"] = (today - df["release_date_parsed"]).dt.days
-    df = df.dropna(subset=["followers_num", "days_since_release"])
-    df = df[df["days_since_release"] > 0]
-
-    df["launch_index"] = df["followers_num"] / df["days_since_release"]
-    top_launch = df.sort_values("launch_index", ascending=False).head(10)
-
-    fig, ax = plt.subplots(figsize=(8, 5))
-    sns.barplot(data=top_launch, x="launch_index", y="name", ax=ax)
-    ax.set_title("Топ-10 запусків за ефективністю")
-    ax.set_xlabel("Індекс запуску")
-    ax.set_ylabel("Назва гри")
-    st.pyplot(fig)
+
+def render_growth_potential(top_launch: pd.DataFrame):
+    def draw():
+        import matplotlib.pyplot as plt
+        import seaborn as sns
+
+        fig, ax = plt.subplots(figsize=(8, 5))
+        sns.barplot(data=top_launch, x="launch_index", y="name", ax=ax)
+        ax.set_title("Топ-10 запусків за ефективністю")
+        ax.set_xlabel("Індекс запуску")
+        ax.set_ylabel("Назва гри")
+        return fig
+
+    show_figure("growth_potential", draw, top_launch[["name", "launch_index"]])
 
     st.subheader("📋 Дані запусків")
-    st.dataframe(
-        top_launch[
-            ["name", "followers_num", "release_date", "days_since_release", "launch_index"]
-        ].reset_index(drop=True)
+    show_table(
+        "growth_potential",
+        top_launch[["name", "followers_num", "release_date", "days_since_release", "launch_index"]],
     )
 
 
-def display_heatmap_rating_price(df: pd.DataFrame):
-    df = df.dropna(subset=["price", "rating", "owners"])
-    df["price_eur"] = df["price"].apply(parse_price)
-    df["rating_pct"] = df["rating"].apply(parse_rating)
-    df["peak"] = df["owners"].apply(parse_peak)
-    df = df.dropna(subset=["price_eur", "rating_pct", "peak"])
-
-    def price_cat(p):
-        if p < 15: return "Low"
-        if p <= 40: return "Mid"
-        return "High"
-
-    def rating_cat(r):
-        if r >= 80: return "Positive"
-        if r >= 50: return "Mixed"
-        return "Negative"
-
-    df["price_cat"] = df["price_eur"].apply(price_cat)
-    df["rating_cat"] = df["rating_pct"].apply(rating_cat)
-
-    pivot = df.pivot_table(
-        index="rating_cat",
-        columns="price_cat",
-        values="peak",
-        aggfunc="mean"
-    )
+def display_growth_potential(df: pd.DataFrame):
+    render_growth_potential(compute_growth_potential(df))
+
+
+@uses_cube
+@uses_columns("price", "rating", "price_eur", "rating_pct", "peak")
+def compute_heatmap_rating_price(df: pd.DataFrame, cube: PriceRatingCube | None = None) -> pd.DataFrame:
+    cube = cube or PriceRatingCube.build(df)
+    peak = cube.means("peak")
+    if peak.empty:
+        return pd.DataFrame()
+    return peak.reorder_levels(["rating_cat", "price_cat"]).sort_index().unstack("price_cat")
 
+
+def render_heatmap_rating_price(pivot: pd.DataFrame):
     if pivot.empty:
         st.warning("⚠️ Недостатньо даних для побудови теплової карти.")
         return
 
     st.subheader("📋 Зведена таблиця")
-    st.dataframe(pivot.reset_index())
+    show_table("heatmap_rating_price", pivot.reset_index())
 
-    fig, ax = plt.subplots(figsize=(8, 5))
-    sns.heatmap(pivot, annot=True, fmt=".0f", cmap="Blues", ax=ax)
-    ax.set_title("Середній пік онлайну: рейтинг + ціна")
-    st.pyplot(fig)
+    def draw():
+        import matplotlib.pyplot as plt
+        import seaborn as sns
 
+        fig, ax = plt.subplots(figsize=(8, 5))
+        sns.heatmap(pivot, annot=True, fmt=".0f", cmap="Blues", ax=ax)
+        ax.set_title("Середній пік онлайну: рейтинг + ціна")
+        return fig
 
-def display_launch_efficiency(df: pd.DataFrame):
-    df = df.dropna(subset=["followers", "release_date"])
-    today = pd.to_datetime("today")
-    df["followers_num"] = df["followers"].apply(parse_followers)
-    df["release_date_parsed"] = df["release_date"].apply(parse_release_date)
-    df["days_since_release"] = (today - df["release_date_parsed"]).dt.days
-    df = df.dropna(subset=["followers_num", "days_since_release"])
-    df = df[df["days_since_release"] > 0]
+    show_figure("heatmap_rating_price", draw, pivot)
 
-    df["launch_index"] = df["followers_num"] / df["days_since_release"]
-    top_launch = df.sort_values("launch_index", ascending=False).head(10)
 
+def display_heatmap_rating_price(df: pd.DataFrame):
+    render_heatmap_rating_price(compute_heatmap_rating_price(df))
+
+
+def launch_index(df: pd.DataFrame, today: pd.Timestamp) -> tuple[pd.Series, pd.Series]:
+    """
+    (launch_index, days_since_release) of every game: 7d gain per day since release,
+    NaN for games without a gain or not released before `today`.
+    """
+    days = (today - df["release_date_parsed"]).dt.days
+    released = df["release_date"].notna() & (days > 0)
+    return (_wide(df["followers_gain"]) / _wide(days)).where(released).rename("launch_index"), days
+
+
+def launch_indexes(df: pd.DataFrame, today: pd.Timestamp) -> pd.DataFrame:
+    """Released games with days_since_release and launch_index (7d gain per day since release)."""
+    index, days = launch_index(df, today)
+    launched = index.notna()
+    return df[launched].assign(
+        followers_num=df["followers_gain"][launched],
+        days_since_release=days[launched],
+        launch_index=index[launched],
+    )
+
+
+def ranking_store(df: pd.DataFrame, today: pd.Timestamp | None = None) -> RankingStore:
+    """
+    RankingStore of the metrics several analyses rank by: followers_gain,
+    launch_index and days_since_release (counted up to `today`, now by default).
+    """
+    today = _today(today)
+    return RankingStore(df, {
+        "followers_gain": lambda df: df["followers_gain"],
+        "days_since_release": lambda df: (today - df["release_date_parsed"]).dt.days,
+        "launch_index": lambda df: launch_index(df, today)[0],
+    })
+
+
+def top_launches(df: pd.DataFrame, rankings: RankingStore, k: int = 10) -> pd.DataFrame:
+    """The k games with the highest launch_index, with followers_num and days_since_release."""
+    top = rankings.top(df, "launch_index", k)
+    days = rankings.values("days_since_release")
+    return top.assign(followers_num=top["followers_gain"], days_since_release=days[top.index])
+
+
+@uses_rankings
+@uses_columns("name", "release_date", "followers_gain", "release_date_parsed")
+def compute_launch_efficiency(df: pd.DataFrame, today: pd.Timestamp | None = None,
+                              rankings: RankingStore | None = None) -> pd.DataFrame:
+    return top_launches(df, rankings or ranking_store(df, today))
+
+
+def render_launch_efficiency(top_launch: pd.DataFrame):
     st.subheader("📋 Деталі запуску (топ-10)")
-    st.dataframe(
-        top_launch[
-            ["name", "followers_num", "release_date", "days_since_release", "launch_index"]
-        ].reset_index(drop=True)
+    show_table(
+        "launch_efficiency",
+        top_launch[["name", "followers_num", "release_date", "days_since_release", "launch_index"]],
     )
 
-    fig, ax = plt.subplots(figsize=(8, 5))
-    sns.barplot(data=top_launch, x="launch_index", y="name", ax=ax)
-    ax.set_title("Топ-10 запусків за ефективністю")
-    ax.set_xlabel("Індекс запуску")
-    ax.set_ylabel("Назва гри")
-    st.pyplot(fig)
+    def draw():
+        import matplotlib.pyplot as plt
+        import seaborn as sns
+
+        fig, ax = plt.subplots(figsize=(8, 5))
+        sns.barplot(data=top_launch, x="launch_index", y="name", ax=ax)
+        ax.set_title("Топ-10 запусків за ефективністю")
+        ax.set_xlabel("Індекс запуску")
+        ax.set_ylabel("Назва гри")
+        return fig
+
+    show_figure("launch_efficiency", draw, top_launch[["name", "launch_index"]])
+
+
+def display_launch_efficiency(df: pd.DataFrame):
+    render_launch_efficiency(compute_launch_efficiency(df))
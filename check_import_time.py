@@ -0,0 +1,64 @@
+# check_import_time.py
+#
+# Measure the cold-start cost of `import app` with `python -X importtime`.
+#
+#     python check_import_time.py [--budget-ms 1000] [--top 10]
+#
+# Exits with status 1 if the import takes longer than the budget or loads one of
+# the plotting/statistics modules that should only be imported when a chart renders.
+
+import argparse
+import subprocess
+import sys
+
+# Cumulative import time allowed for `import app`, in milliseconds
+IMPORT_BUDGET_MS = 1000
+
+# Heavy modules that must not be loaded at startup
+DEFERRED_MODULES = ("matplotlib.pyplot", "seaborn", "statsmodels")
+
+
+def measure(module: str = "app") -> list[tuple[str, int, int, int]]:
+    """
+    Import `module` in a fresh interpreter and return (name, depth, self_us, cumulative_us)
+    for every module it loaded, in import-time report order.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        depth = (len(name) - len(name.lstrip())) // 2
+        rows.append((name.strip(), depth, int(self_us), int(cumulative_us)))
+    return rows
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Measure the cold-start cost of `import app`.")
+    parser.add_argument("--budget-ms", type=float, default=IMPORT_BUDGET_MS)
+    parser.add_argument("--top", type=int, default=10, help="slowest direct imports to list")
+    args = parser.parse_args()
+
+    rows = measure("app")
+    total_ms = next(cumulative for name, depth, _, cumulative in rows if name == "app" and depth == 0) / 1000
+    loaded = {name for name, *_ in rows}
+
+    print(f"import app: {total_ms:.0f} ms (budget {args.budget_ms:.0f} ms)")
+    direct = sorted((row for row in rows if row[1] == 1), key=lambda row: -row[3])
+    for name, _, _, cumulative in direct[: args.top]:
+        print(f"  {cumulative / 1000:8.1f} ms  {name}")
+
+    eager = [name for name in DEFERRED_MODULES if name in loaded]
+    if eager:
+        print(f"loaded at startup but should be deferred: {', '.join(eager)}")
+    return 1 if eager or total_ms > args.budget_ms else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,109 @@
+# compaction.py
+#
+# Shrink a normalized frame once its raw strings are parsed:
+#
+#     python compaction.py steamdb.csv
+#
+# prints the memory of every column before and after compact().
+
+import sys
+
+import numpy as np
+import pandas as pd
+
+# Raw strings nothing displays: only their parsed counts (followers_gain, peak) are used
+PARSED_ONLY_COLUMNS = ("followers", "owners")
+
+# Parsed counts, stored as the smallest integer type that holds them
+COUNT_COLUMNS = ("followers_gain", "peak")
+
+# Displayed strings with many repeats, stored as category (dictionary-encoded)
+CATEGORY_COLUMNS = ("price", "rating", "discount", "release_date")
+
+# Largest integer magnitude float32 represents exactly. Prices and ratings stay float64:
+# in float32, €0.99 is 0.9900000095, which shows in tables and reports and shifts ratios
+FLOAT32_EXACT = 2**24
+
+_UNSIGNED = (np.uint8, np.uint16, np.uint32, np.uint64)
+_SIGNED = (np.int8, np.int16, np.int32, np.int64)
+
+
+def _compact_count(s: pd.Series) -> pd.Series:
+    values = s.to_numpy(dtype=float)
+    present = values[~np.isnan(values)]
+    if len(present) == 0:
+        return s.astype(np.float32)
+    if (present != np.floor(present)).any():
+        return s
+    low, high = present.min(), present.max()
+    if len(present) == len(values):
+        for dtype in _UNSIGNED if low >= 0 else _SIGNED:
+            info = np.iinfo(dtype)
+            if info.min <= low and high <= info.max:
+                return s.astype(dtype)
+    # Missing counts need NaN; float32 is smaller than a nullable integer (no mask)
+    if -FLOAT32_EXACT <= low and high <= FLOAT32_EXACT:
+        return s.astype(np.float32)
+    return s
+
+
+def compact(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Compact copy of a normalized frame: raw follower and owner strings are dropped,
+    counts take the smallest integer type that holds them (float32 if some are
+    missing) and repeated display strings become category. Compacting a compact
+    frame changes nothing.
+    """
+    columns = {}
+    for name in df.columns:
+        s = df[name]
+        if name in PARSED_ONLY_COLUMNS:
+            continue
+        if name in COUNT_COLUMNS:
+            s = _compact_count(s)
+        elif name in CATEGORY_COLUMNS and not isinstance(s.dtype, pd.CategoricalDtype):
+            s = s.astype("category")
+        columns[name] = s
+    return pd.DataFrame(columns, index=df.index)
+
+
+def memory_report(before: pd.DataFrame, after: pd.DataFrame) -> pd.DataFrame:
+    """
+    Memory (bytes, strings included) and dtype of every column before and after
+    compaction, with a "total" row. Dropped columns have 0 bytes after.
+    """
+    names = list(dict.fromkeys([*before.columns, *after.columns]))
+    report = pd.DataFrame({
+        "dtype_before": before.dtypes.astype(str),
+        "bytes_before": before.memory_usage(index=False, deep=True),
+        "dtype_after": after.dtypes.astype(str),
+        "bytes_after": after.memory_usage(index=False, deep=True),
+    }).reindex(names)
+    report[["dtype_before", "dtype_after"]] = report[["dtype_before", "dtype_after"]].fillna("—")
+    report[["bytes_before", "bytes_after"]] = report[["bytes_before", "bytes_after"]].fillna(0).astype("int64")
+    total = pd.DataFrame({
+        "dtype_before": [""],
+        "bytes_before": [report["bytes_before"].sum()],
+        "dtype_after": [""],
+        "bytes_after": [report["bytes_after"].sum()],
+    }, index=["total"])
+    report = pd.concat([report, total])
+    report["ratio"] = report["bytes_after"] / report["bytes_before"].where(report["bytes_before"] > 0)
+    return report
+
+
+def main() -> int:
+    if len(sys.argv) != 2:
+        print("usage: python compaction.py <csv>", file=sys.stderr)
+        return 2
+    from data_loader import normalize, read_raw_csv
+
+    df = normalize(read_raw_csv(sys.argv[1]))
+    report = memory_report(df, compact(df))
+    report[["bytes_before", "bytes_after"]] = report[["bytes_before", "bytes_after"]] / 2**20
+    print(report.rename(columns={"bytes_before": "MiB_before", "bytes_after": "MiB_after"}).round(2).to_string())
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
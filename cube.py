@@ -0,0 +1,146 @@
+# cube.py
+#
+# Games aggregated by price bucket × rating bucket × discount flag (18 cells). Each
+# cell keeps the count, sum, min and max of followers_gain and peak, and a quantile
+# sketch of their values (see sketch.QuantileSketch). All of it merges, so a cube is
+# built in one vectorized pass over a frame, extended with appended rows or combined
+# from chunks, and the segmentation and heatmap charts read it instead of the rows.
+
+import functools
+
+import numpy as np
+import pandas as pd
+
+from sketch import QuantileSketch
+
+PRICE_LABELS = np.array(["Low", "Mid", "High"])
+RATING_LABELS = np.array(["Negative", "Mixed", "Positive"])
+
+# Aggregated columns; each counts only the rows where it has a value
+MEASURES = ("followers_gain", "peak")
+
+# A game is placed in a cell only if it has all of these
+KEY_COLUMNS = ("price", "rating", "price_eur", "rating_pct")
+
+# (price bucket, rating bucket, discounted)
+SHAPE = (len(PRICE_LABELS), len(RATING_LABELS), 2)
+CELLS = int(np.prod(SHAPE))
+
+
+def price_buckets(price_eur) -> np.ndarray:
+    """0 (Low, < €15), 1 (Mid, €15–40) or 2 (High, > €40) for each price."""
+    price_eur = np.asarray(price_eur, dtype=float)
+    return np.select([price_eur < 15, price_eur <= 40], [0, 1], 2)
+
+
+def rating_buckets(rating_pct) -> np.ndarray:
+    """2 (Positive, >= 80%), 1 (Mixed, >= 50%) or 0 (Negative) for each rating."""
+    rating_pct = np.asarray(rating_pct, dtype=float)
+    return np.select([rating_pct >= 80, rating_pct >= 50], [2, 1], 0)
+
+
+class PriceRatingCube:
+    """
+    Per-cell count, sum, min, max and quantile sketch of each of MEASURES. Filled by
+    update() (in place, e.g. chunk by chunk) or merged() (a new cube, so one that is
+    being read is never modified).
+    """
+
+    def __init__(self):
+        self.count = {m: np.zeros(CELLS, dtype=np.int64) for m in MEASURES}
+        self.sum = {m: np.zeros(CELLS) for m in MEASURES}
+        self.min = {m: np.full(CELLS, np.inf) for m in MEASURES}
+        self.max = {m: np.full(CELLS, -np.inf) for m in MEASURES}
+        self.sketches = {m: [QuantileSketch() for _ in range(CELLS)] for m in MEASURES}
+
+    @classmethod
+    def build(cls, df: pd.DataFrame) -> "PriceRatingCube":
+        cube = cls()
+        cube.update(df)
+        return cube
+
+    def update(self, df: pd.DataFrame):
+        """
+        Add the rows of `df`. Measures or discount columns it lacks count as missing
+        values and no discount.
+        """
+        keyed = np.ones(len(df), dtype=bool)
+        for column in KEY_COLUMNS:
+            keyed &= df[column].notna().to_numpy()
+        discounted = np.zeros(len(df), dtype=bool)
+        if "has_discount" in df and "discount_in_price" in df:
+            # Same flag as charts.discount_mask
+            discounted = (df["has_discount"] | df["discount_in_price"]).to_numpy(dtype=bool)
+        cells = np.ravel_multi_index(
+            (price_buckets(df["price_eur"]), rating_buckets(df["rating_pct"]), discounted.astype(np.int64)), SHAPE
+        )[keyed]
+
+        for m in MEASURES:
+            if m not in df:
+                continue
+            values = df[m].to_numpy(dtype=float, na_value=np.nan)[keyed]
+            present = ~np.isnan(values)
+            cell, value = cells[present], values[present]
+            self.count[m] += np.bincount(cell, minlength=CELLS)
+            self.sum[m] += np.bincount(cell, weights=value, minlength=CELLS)
+            np.minimum.at(self.min[m], cell, value)
+            np.maximum.at(self.max[m], cell, value)
+            order = np.argsort(cell, kind="stable")
+            bounds = np.searchsorted(cell[order], np.arange(CELLS + 1))
+            for c in np.flatnonzero(np.diff(bounds)):
+                self.sketches[m][c].update(value[order[bounds[c]:bounds[c + 1]]])
+
+    def merged(self, other: "PriceRatingCube") -> "PriceRatingCube":
+        result = PriceRatingCube()
+        for m in MEASURES:
+            result.count[m] = self.count[m] + other.count[m]
+            result.sum[m] = self.sum[m] + other.sum[m]
+            result.min[m] = np.minimum(self.min[m], other.min[m])
+            result.max[m] = np.maximum(self.max[m], other.max[m])
+            result.sketches[m] = [a.merged(b) for a, b in zip(self.sketches[m], other.sketches[m])]
+        return result
+
+    def cells(self, measure: str, discount: bool | None = None) -> pd.DataFrame:
+        """
+        count, sum, min, max and mean of `measure` per (price_cat, rating_cat) cell that
+        has values, over both discount flags or only `discount`. Ordered by label, like
+        a groupby on the category names.
+        """
+        flags = [0, 1] if discount is None else [int(discount)]
+
+        def over_flags(array, reduce):
+            return reduce(array.reshape(SHAPE)[:, :, flags], axis=2).ravel()
+
+        count = over_flags(self.count[measure], np.sum)
+        price, rating = np.divmod(np.arange(count.size), len(RATING_LABELS))
+        frame = pd.DataFrame(
+            {
+                "count": count,
+                "sum": over_flags(self.sum[measure], np.sum),
+                "min": over_flags(self.min[measure], np.min),
+                "max": over_flags(self.max[measure], np.max),
+            },
+            index=pd.MultiIndex.from_arrays(
+                [PRICE_LABELS[price], RATING_LABELS[rating]], names=["price_cat", "rating_cat"]
+            ),
+        )[count > 0]
+        return frame.assign(mean=frame["sum"] / frame["count"]).sort_index()
+
+    def means(self, measure: str, discount: bool | None = None) -> pd.Series:
+        """Mean of `measure` per (price_cat, rating_cat) cell, named after the measure."""
+        return self.cells(measure, discount)["mean"].rename(measure)
+
+    def quantile(self, measure: str, q: float, price: str | None = None, rating: str | None = None,
+                 discount: bool | None = None) -> float:
+        """
+        The q-quantile of `measure` over the cells matching `price`, `rating` (labels)
+        and `discount`; None matches every bucket. NaN if there are no values. Exact
+        unless a cell has too many distinct values (see sketch.EXACT_DISTINCT).
+        """
+        cells = np.arange(CELLS).reshape(SHAPE)[
+            slice(None) if price is None else int(np.flatnonzero(PRICE_LABELS == price)[0]),
+            slice(None) if rating is None else int(np.flatnonzero(RATING_LABELS == rating)[0]),
+            slice(None) if discount is None else int(discount),
+        ]
+        sketches = [self.sketches[measure][c] for c in np.ravel(cells)]
+        return functools.reduce(QuantileSketch.merged, sketches).quantile(q)
@@ -1,37 +1,582 @@
 # data_loader.py
 
+import functools
+import io
+import json
+import multiprocessing
 import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 import streamlit as st
 
+import perf
+from compaction import compact, memory_report
+from snapshots import save_snapshot, snapshot_dir
+from sql_backend import build_database, database_path, database_version
+from watchdog.events import FileSystemEventHandler
+from watchdog.observers import Observer
+from parsers import (
+    parse_followers_series,
+    parse_price_series,
+    parse_rating_series,
+    parse_discount_series,
+    parse_peak_series,
+    parse_release_date_series,
+)
+
+# Loaded frames are shared across sessions (see shared_dataset). Copy-on-write makes
+# selections of them views, and guarantees a derived frame never writes through to them.
+pd.set_option("mode.copy_on_write", True)
+
 # Default CSV file paths — update these to match your environment
 MAIN_CSV_PATH = "/Users/aroslavgladkij/Documents/GitHub/steamdb/steamdb.csv"
 UPCOMING_CSV_PATH = "/Users/aroslavgladkij/Documents/GitHub/steamdb/steamdb_upcoming.csv"
 
-def load_main_csv(path: str = MAIN_CSV_PATH) -> pd.DataFrame | None:
+# Raw CSV columns the analyses read, with fixed dtypes: free text stays object,
+# short repeated strings (prices, ratings, discounts) are read as category.
+# Any other scraper column is skipped on load.
+CSV_DTYPES = {
+    "name": "object",
+    "followers": "object",
+    "price": "category",
+    "rating": "category",
+    "discount": "category",
+    "owners": "object",
+    "release_date": "object",
+}
+
+# File versions whose parsed frame stays in memory (see shared_dataset): the main and
+# upcoming CSVs, each with room for the previous version while sessions move over
+SHARED_VERSIONS = 4
+
+# Files at least this large are parsed by byte range in a process pool (see read_normalized_parallel)
+PARALLEL_PARSE_MIN_BYTES = 256 * 2**20
+
+# Worker processes for a parallel parse
+PARSE_WORKERS = os.cpu_count() or 1
+
+# Bytes read at a time while scanning for record boundaries
+SPLIT_SCAN_BYTES = 16 * 2**20
+
+# Bytes at the start of a file, and just before the ingested offset, that must be
+# unchanged for new bytes to count as an append rather than a rewrite
+INGEST_FINGERPRINT_BYTES = 4096
+
+# File versions an IncrementalCSV remembers the generation of (see generation_of)
+REMEMBERED_VERSIONS = 16
+
+# Parquet metadata key holding the (mtime_ns, size) of the CSV a sidecar was built from
+SIDECAR_VERSION_KEY = b"steamdb_source_version"
+
+# Parquet metadata key and value marking how the sidecar's columns are stored; sidecars
+# of another format (2: float64 prices and ratings) are rebuilt
+SIDECAR_FORMAT_KEY = b"steamdb_sidecar_format"
+SIDECAR_FORMAT = b"2"
+
+def file_version(path: str) -> tuple[int, int]:
     """
-    Load the main Steam dataset.
-    Shows a Streamlit error and returns None if the file is missing or fails to load.
+    Return (mtime_ns, size) of a file, used as the cache key for its parsed contents.
+    """
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
+
+def read_raw_csv(path: str) -> pd.DataFrame:
+    """
+    Read the CSV columns listed in CSV_DTYPES with their fixed dtypes.
+    Columns missing from the file are simply absent from the result.
+    """
+    return pd.read_csv(path, usecols=lambda c: c in CSV_DTYPES, dtype=CSV_DTYPES)
+
+def iter_raw_csv(path: str, chunksize: int):
+    """
+    Read the CSV in chunks of `chunksize` rows with the same columns and dtypes as read_raw_csv.
+    """
+    return pd.read_csv(path, usecols=lambda c: c in CSV_DTYPES, dtype=CSV_DTYPES, chunksize=chunksize)
+
+def normalize(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Add the typed columns every analysis needs, parsed once from the raw strings:
+    followers_gain, price_eur, rating_pct, peak, has_discount, discount_in_price
+    and release_date_parsed. Raw columns are kept for display.
+    """
+    df = df.copy()
+    if "followers" in df:
+        df["followers_gain"] = parse_followers_series(df["followers"])
+    if "price" in df:
+        df["price_eur"] = parse_price_series(df["price"])
+        df["discount_in_price"] = parse_discount_series(df["price"])
+    if "rating" in df:
+        df["rating_pct"] = parse_rating_series(df["rating"])
+    if "owners" in df:
+        df["peak"] = parse_peak_series(df["owners"])
+    if "discount" in df:
+        df["has_discount"] = parse_discount_series(df["discount"])
+    if "release_date" in df:
+        df["release_date_parsed"] = parse_release_date_series(df["release_date"])
+    return df
+
+def _count_quotes(f, start: int, end: int) -> int:
+    f.seek(start)
+    count, remaining = 0, end - start
+    while remaining > 0:
+        block = f.read(min(SPLIT_SCAN_BYTES, remaining))
+        if not block:
+            break
+        count += block.count(b'"')
+        remaining -= len(block)
+    return count
+
+def _next_record(f, start: int, quotes: int) -> tuple[int, int]:
+    # First offset after an unquoted newline at or past `start`, and the quote count there.
+    # `quotes` is the number of quote characters before `start`; inside a quoted field it is odd.
+    f.seek(start)
+    position = start
+    while True:
+        block = f.read(SPLIT_SCAN_BYTES)
+        if not block:
+            return position, quotes
+        i = 0
+        while (j := block.find(b"\n", i)) >= 0:
+            quotes += block.count(b'"', i, j)
+            if quotes % 2 == 0:
+                return position + j + 1, quotes
+            i = j + 1
+        quotes += block.count(b'"', i)
+        position += len(block)
+
+def _record_end(f, start: int, end: int) -> int:
+    # Offset after the last record that ends at or before `end`: the last newline outside
+    # quotes, found by counting the quotes from `start` (a record boundary) and walking
+    # back from `end`. `start` if no record ends in between.
+    quotes = _count_quotes(f, start, end)
+    while end > start:
+        block_start = max(end - SPLIT_SCAN_BYTES, start)
+        f.seek(block_start)
+        block = f.read(end - block_start)
+        j = len(block)
+        while (i := block.rfind(b"\n", 0, j)) >= 0:
+            quotes -= block.count(b'"', i, j)
+            if quotes % 2 == 0:
+                return block_start + i + 1
+            j = i
+        quotes -= block.count(b'"', 0, j)
+        end = block_start
+    return start
+
+def split_csv(path: str, parts: int, size: int | None = None) -> tuple[int, list[tuple[int, int]]]:
+    """
+    Split a CSV (its first `size` bytes if given) into at most `parts` byte ranges of
+    about equal size that start and end on record boundaries. A newline only ends a
+    record outside quotes (after an even number of quote characters), so quoted fields
+    with line breaks are never cut. Returns the end offset of the header and the
+    (start, end) ranges after it.
+    """
+    size = os.path.getsize(path) if size is None else size
+    with open(path, "rb") as f:
+        header_end, quotes = _next_record(f, 0, 0)
+        bounds, position = [header_end], header_end
+        for i in range(1, parts):
+            target = header_end + (size - header_end) * i // parts
+            if target <= position:
+                continue
+            quotes += _count_quotes(f, position, target)
+            position, quotes = _next_record(f, target, quotes)
+            if position >= size:
+                break
+            bounds.append(position)
+    bounds.append(size)
+    return header_end, list(zip(bounds, bounds[1:]))
+
+def _parse_range(path: str, header_end: int, start: int, end: int) -> pd.DataFrame:
+    with open(path, "rb") as f:
+        header = f.read(header_end)
+        f.seek(start)
+        body = f.read(end - start)
+    raw = pd.read_csv(io.BytesIO(header + body), usecols=lambda c: c in CSV_DTYPES, dtype=CSV_DTYPES)
+    return normalize(raw)
+
+def read_normalized_parallel(path: str, workers: int = PARSE_WORKERS, size: int | None = None) -> pd.DataFrame:
+    """
+    Read and normalize a CSV (its first `size` bytes if given, which must end on a
+    record boundary) on `workers` cores: the file is split into byte ranges on record
+    boundaries (see split_csv), each range is read and normalized in a worker process,
+    and the typed results are concatenated. Same result as normalize(read_raw_csv(path)).
+    """
+    header_end, ranges = split_csv(path, workers, size)
+    if len(ranges) <= 1:
+        if size is not None:
+            return _parse_range(path, header_end, header_end, max(size, header_end))
+        return normalize(read_raw_csv(path))
+    # spawn: workers must not inherit Streamlit's threads
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=len(ranges), mp_context=context) as pool:
+        frames = list(pool.map(
+            _parse_range,
+            [path] * len(ranges),
+            [header_end] * len(ranges),
+            *zip(*ranges),
+        ))
+    return concat_normalized(frames)
+
+@st.cache_resource(show_spinner=False)
+def memory_reports() -> dict:
+    """
+    Process-wide map from a CSV path to (version, memory_report) of its last compaction.
+    """
+    return {}
+
+def compact_recorded(df: pd.DataFrame, path: str, version: tuple[int, int]) -> pd.DataFrame:
+    """
+    compact() a freshly parsed frame and keep its memory report (see memory_reports).
+    """
+    compacted = compact(df)
+    memory_reports()[path] = (version, memory_report(df, compacted))
+    return compacted
+
+def memory_usage(path: str) -> pd.DataFrame | None:
+    """
+    Per-column memory before and after compaction from the last time `path` was parsed
+    in this process, or None if it was only read from its sidecar so far.
+    """
+    entry = memory_reports().get(path)
+    return entry[1] if entry else None
+
+def sidecar_path(path: str) -> str:
+    """
+    Path of the Parquet sidecar kept next to a CSV: steamdb.csv -> steamdb.parquet.
+    """
+    return os.path.splitext(path)[0] + ".parquet"
+
+def _sidecar_version(sidecar: str) -> tuple[int, int] | None:
+    try:
+        metadata = pq.read_schema(sidecar).metadata or {}
+    except (OSError, pa.ArrowInvalid):
+        return None
+    raw = metadata.get(SIDECAR_VERSION_KEY)
+    if not raw or metadata.get(SIDECAR_FORMAT_KEY) != SIDECAR_FORMAT:
+        return None
+    return tuple(json.loads(raw))
+
+def write_sidecar(df: pd.DataFrame, sidecar: str, version: tuple[int, int]):
+    """
+    Write a normalized frame to a Parquet sidecar, tagged with the source CSV version.
+    The file is written to a temporary name first so readers never see a partial sidecar.
+    """
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    metadata = dict(table.schema.metadata or {})
+    metadata[SIDECAR_VERSION_KEY] = json.dumps(list(version)).encode()
+    metadata[SIDECAR_FORMAT_KEY] = SIDECAR_FORMAT
+    tmp = sidecar + ".tmp"
+    pq.write_table(table.replace_schema_metadata(metadata), tmp)
+    os.replace(tmp, sidecar)
+
+@st.cache_resource(show_spinner=False, max_entries=SHARED_VERSIONS)
+def shared_dataset(path: str, version: tuple[int, int]) -> pd.DataFrame:
     """
+    The normalized, compacted contents of `path` at `version`: one frame per file
+    version, shared by every session and thread. It is read-only; analyses select
+    from it (see charts.py) and never assign into it.
+    """
+    # `version` is only part of the cache key: a changed file gets a fresh entry
+    sidecar = sidecar_path(path)
+    if _sidecar_version(sidecar) == version:
+        return _read_sidecar(sidecar)
+
+    if version[1] >= PARALLEL_PARSE_MIN_BYTES:
+        with perf.stage("parse"):
+            df = read_normalized_parallel(path)
+    else:
+        raw = read_raw_csv(path)
+        with perf.stage("parse"):
+            df = normalize(raw)
+    with perf.stage("compact"):
+        df = compact_recorded(df, path, version)
+    try:
+        with perf.stage("sidecar"):
+            write_sidecar(df, sidecar, version)
+    except (OSError, pa.ArrowException):
+        # Read-only location or a column Arrow cannot type: keep serving from the CSV
+        pass
+    if path == MAIN_CSV_PATH:
+        # Each new export of the main CSV is also kept as a dated follower snapshot
+        try:
+            with perf.stage("snapshot"):
+                save_snapshot(df, snapshot_dir(path), datetime.fromtimestamp(version[0] / 1e9).date())
+        except (OSError, pa.ArrowException):
+            pass
+    return df
+
+def _read_sidecar(sidecar: str, columns: tuple[str, ...] | None = None) -> pd.DataFrame:
+    if columns:
+        available = set(pq.read_schema(sidecar).names)
+        columns = [c for c in columns if c in available]
+    # compact() is a no-op on current sidecars and upgrades older ones
+    return compact(pd.read_parquet(sidecar, columns=columns or None))
+
+def _project(df: pd.DataFrame, columns: tuple[str, ...] | None) -> pd.DataFrame:
+    # Copy-on-write makes this a view: no column data is copied
+    return df[[c for c in columns if c in df]] if columns else df
+
+def read_normalized(path: str, version: tuple[int, int], columns: tuple[str, ...] | None = None) -> pd.DataFrame:
+    """
+    The shared normalized contents of `path` at `version` (only `columns` if given),
+    without the Streamlit error messages of the loaders. Raises if the file is
+    missing or cannot be parsed. With `columns` and a current sidecar, only those
+    columns are read from it, uncached: for batch workers that run one analysis each
+    (see report.py) and have no use for the whole shared frame.
+    """
+    sidecar = sidecar_path(path)
+    if columns and _sidecar_version(sidecar) == version:
+        return _read_sidecar(sidecar, columns)
+    return _project(shared_dataset(path, version), columns)
+
+def _with_categories(df: pd.DataFrame, categories: dict) -> pd.DataFrame:
+    return df.assign(**{c: df[c].cat.set_categories(cats) for c, cats in categories.items()})
+
+def concat_normalized(frames: list[pd.DataFrame]) -> pd.DataFrame:
+    """
+    Concatenate normalized frames, keeping category columns categorical (with the
+    union of every frame's categories) instead of falling back to object.
+    """
+    first = frames[0]
+    categories = {
+        c: functools.reduce(lambda a, b: a.union(b), (frame[c].cat.categories for frame in frames))
+        for c in first.columns
+        if all(isinstance(frame[c].dtype, pd.CategoricalDtype) for frame in frames)
+    }
+    return pd.concat([_with_categories(frame, categories) for frame in frames], ignore_index=True)
+
+class IncrementalCSV:
+    """
+    Normalized contents of a CSV the scraper appends to. Remembers the byte offset and
+    row count already parsed; refresh() parses only the complete lines appended since
+    and merges them in, or rebuilds from scratch if the file was rewritten. Each rebuild
+    starts a new `generation`.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.lock = threading.Lock()
+        self.frame = None
+        self.version = None
+        self.offset = 0
+        self.rows = 0
+        self.header = b""
+        self.head = b""
+        self.edge = b""
+        self.generation = 0
+        # Recent file versions -> generation of the frame at that version
+        self.generations = OrderedDict()
+
+    def refresh(self) -> tuple[int, int]:
+        """Bring the frame up to date with the file and return the file version it reflects."""
+        with self.lock:
+            version = file_version(self.path)
+            if version == self.version:
+                return version
+            with open(self.path, "rb") as f:
+                if self.frame is not None and self._appended(f, version[1]):
+                    self._append(f, version[1])
+                else:
+                    self._rebuild(f, version)
+            self.version = version
+            self.generations[version] = self.generation
+            while len(self.generations) > REMEMBERED_VERSIONS:
+                self.generations.popitem(last=False)
+            return version
+
+    def snapshot(self, columns: tuple[str, ...] | None = None) -> tuple[pd.DataFrame, tuple[int, int]]:
+        """
+        The current frame (only `columns` if given) with the file version it reflects.
+        Appends replace the frame rather than modify it, so it is shared, not copied.
+        """
+        with self.lock:
+            frame, version = self.frame, self.version
+        return _project(frame, columns), version
+
+    def generation_of(self, version: tuple[int, int]) -> int | None:
+        """
+        The generation of the frame at `version` (None if too old to be remembered).
+        Frames of one generation only differ by rows appended at the end, so aggregates
+        of one of them can be extended to a later one instead of starting over.
+        """
+        with self.lock:
+            return self.generations.get(version)
+
+    def _read_at(self, f, start: int, length: int) -> bytes:
+        f.seek(start)
+        return f.read(length)
+
+    def _appended(self, f, size: int) -> bool:
+        # Same leading bytes and same bytes up to the offset: only the end moved
+        if size < self.offset:
+            return False
+        edge_start = max(self.offset - INGEST_FINGERPRINT_BYTES, 0)
+        return (
+            self._read_at(f, 0, len(self.head)) == self.head
+            and self._read_at(f, edge_start, self.offset - edge_start) == self.edge
+        )
+
+    def _parse(self, data: bytes) -> pd.DataFrame:
+        raw = pd.read_csv(io.BytesIO(data), usecols=lambda c: c in CSV_DTYPES, dtype=CSV_DTYPES)
+        with perf.stage("parse"):
+            return compact(normalize(raw))
+
+    def _append(self, f, size: int):
+        # A record still being written, possibly a quoted field with line breaks, is
+        # left for the next refresh
+        end = _record_end(f, self.offset, size)
+        if end == self.offset:
+            return
+        complete = self._read_at(f, self.offset, end - self.offset)
+        tail = self._parse(self.header + complete)
+        # Re-compacted: the tail's counts may need a wider type than the frame's
+        self.frame = compact(concat_normalized([self.frame, tail]))
+        self._advance(f, self.offset + len(complete), self.rows + len(tail))
+
+    def _rebuild(self, f, version: tuple[int, int]):
+        # The rows come from the sidecar, which costs a read of the header and a few
+        # bytes, or are parsed from the file by range, in parallel when it is large
+        sidecar = sidecar_path(self.path)
+        f.seek(0)
+        self.header = f.readline()
+        self.head = self._read_at(f, 0, min(INGEST_FINGERPRINT_BYTES, version[1]))
+        # A sidecar written while the last row was half-written holds that row as it
+        # was then; only one of a file that ends on a complete line is usable
+        complete = version[1] == 0 or self._read_at(f, version[1] - 1, 1) == b"\n"
+        if _sidecar_version(sidecar) == version and complete:
+            self.frame, end = compact(pd.read_parquet(sidecar)), version[1]
+        else:
+            # A file without a complete record yet is parsed as it is (header only)
+            end = _record_end(f, 0, version[1]) or version[1]
+            workers = PARSE_WORKERS if end >= PARALLEL_PARSE_MIN_BYTES else 1
+            with perf.stage("parse"):
+                self.frame = compact(read_normalized_parallel(self.path, workers, end))
+        self.generation += 1
+        self._advance(f, end, len(self.frame))
+
+    def _advance(self, f, offset: int, rows: int):
+        edge_start = max(offset - INGEST_FINGERPRINT_BYTES, 0)
+        self.offset, self.rows = offset, rows
+        self.edge = self._read_at(f, edge_start, offset - edge_start)
+
+class _RefreshOnChange(FileSystemEventHandler):
+    def __init__(self, csv: IncrementalCSV):
+        self.csv = csv
+        self.path = os.path.abspath(csv.path)
+
+    def on_any_event(self, event):
+        paths = {event.src_path, getattr(event, "dest_path", "")}
+        if self.path not in {os.path.abspath(p) for p in paths if p}:
+            return
+        try:
+            self.csv.refresh()
+        except Exception:
+            # Half-written or briefly missing file: the next event or load retries
+            pass
+
+@st.cache_resource(show_spinner=False)
+def incremental_csv(path: str) -> IncrementalCSV:
+    """
+    The process-wide IncrementalCSV for `path`, refreshed by a watchdog observer whenever
+    the file changes, so new scraper rows are merged in before the next rerun asks for them.
+    """
+    csv = IncrementalCSV(path)
+    observer = Observer()
+    observer.schedule(_RefreshOnChange(csv), os.path.dirname(os.path.abspath(path)))
+    observer.daemon = True
+    observer.start()
+    return csv
+
+def _load_versioned(path: str, incremental: bool = False) -> tuple[pd.DataFrame, tuple[int, int]] | None:
     if not os.path.exists(path):
         st.error(f"❌ CSV-файл не знайдено за шляхом: `{path}`")
         return None
     try:
-        return pd.read_csv(path)
+        if incremental:
+            csv = incremental_csv(path)
+            csv.refresh()
+            return csv.snapshot()
+        version = file_version(path)
+        return shared_dataset(path, version), version
     except Exception as e:
         st.error(f"❌ Помилка при завантаженні `{path}`: {e}")
         return None
 
-def load_upcoming_csv(path: str = UPCOMING_CSV_PATH) -> pd.DataFrame | None:
+def _load_csv(path: str, columns: tuple[str, ...] | None = None, incremental: bool = False) -> pd.DataFrame | None:
+    loaded = _load_versioned(path, incremental)
+    return None if loaded is None else _project(loaded[0], columns)
+
+def dataset_path(dataset: str) -> str:
     """
-    Load the upcoming Steam releases dataset.
-    Shows a Streamlit error and returns None if the file is missing or fails to load.
+    CSV path of a named dataset: "main" or "upcoming".
+    """
+    return {"main": MAIN_CSV_PATH, "upcoming": UPCOMING_CSV_PATH}[dataset]
+
+def load_dataset(dataset: str, columns: tuple[str, ...] | None = None, incremental: bool = False) -> pd.DataFrame | None:
+    """
+    Load a named dataset ("main" or "upcoming") like load_main_csv / load_upcoming_csv.
+    With `incremental`, rows appended to the CSV since the last load are parsed and
+    merged in (see IncrementalCSV) instead of re-reading the whole file.
+    """
+    return _load_csv(dataset_path(dataset), columns, incremental)
+
+def load_versioned(dataset: str, incremental: bool = False) -> tuple[pd.DataFrame, tuple[int, int]] | None:
+    """
+    The whole frame of a named dataset and the file version it reflects, taken together
+    in one read (one snapshot in incremental mode). Anything derived from the frame
+    (filter indexes, shared rankings, cached results) is keyed by this version, never
+    by one read separately, which could belong to a newer frame.
+    Shows a Streamlit error and returns None like load_dataset.
     """
+    return _load_versioned(dataset_path(dataset), incremental)
+
+@st.cache_resource(show_spinner=False)
+def _database(path: str, version: tuple[int, int]) -> str:
+    db = database_path(path)
+    if database_version(db) != version:
+        df = shared_dataset(path, version)
+        with perf.stage("sqlite"):
+            build_database(df, db, version)
+    return db
+
+def load_database(dataset: str) -> str | None:
+    """
+    Path of the SQLite copy of a named dataset (see sql_backend), built on first use
+    and rebuilt when the CSV changes. Shows a Streamlit error and returns None if the
+    file is missing or the database cannot be built.
+    """
+    path = dataset_path(dataset)
     if not os.path.exists(path):
         st.error(f"❌ CSV-файл не знайдено за шляхом: `{path}`")
         return None
     try:
-        return pd.read_csv(path)
+        return _database(path, file_version(path))
     except Exception as e:
-        st.error(f"❌ Помилка при завантаженні `{path}`: {e}")
+        st.error(f"❌ Помилка при створенні бази даних для `{path}`: {e}")
         return None
+
+def load_main_csv(path: str = MAIN_CSV_PATH, columns: tuple[str, ...] | None = None) -> pd.DataFrame | None:
+    """
+    Load the main Steam dataset with its parsed columns (see normalize), compacted
+    (see compaction.compact). The first load writes a Parquet sidecar next to the CSV.
+    Every session gets (a view of `columns` of) the same read-only frame until the
+    file changes; see shared_dataset.
+    Shows a Streamlit error and returns None if the file is missing or fails to load.
+    """
+    return _load_csv(path, columns)
+
+def load_upcoming_csv(path: str = UPCOMING_CSV_PATH, columns: tuple[str, ...] | None = None) -> pd.DataFrame | None:
+    """
+    Load the upcoming Steam releases dataset with its parsed columns (see normalize), compacted
+    (see compaction.compact). The first load writes a Parquet sidecar next to the CSV.
+    Every session gets (a view of `columns` of) the same read-only frame until the
+    file changes; see shared_dataset.
+    Shows a Streamlit error and returns None if the file is missing or fails to load.
+    """
+    return _load_csv(path, columns)
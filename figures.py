@@ -0,0 +1,63 @@
+# figures.py
+
+import hashlib
+import io
+import pickle
+
+import pandas as pd
+import streamlit as st
+
+import perf
+
+# Same savefig settings st.pyplot uses
+SAVEFIG_KWARGS = {"format": "png", "dpi": 200, "bbox_inches": "tight"}
+
+# Rendered images kept across reruns and sessions
+MAX_CACHED_FIGURES = 256
+
+
+def fingerprint(*data) -> str:
+    """
+    Content hash of the data a figure is drawn from (DataFrames, Series, arrays
+    or any picklable value). Equal data gives an equal fingerprint.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for item in data:
+        if isinstance(item, (pd.DataFrame, pd.Series)):
+            labels = list(item.columns) if isinstance(item, pd.DataFrame) else [item.name]
+            digest.update(repr((item.shape, labels)).encode())
+            digest.update(pd.util.hash_pandas_object(item).to_numpy().tobytes())
+        else:
+            digest.update(pickle.dumps(item))
+    return digest.hexdigest()
+
+
+def rasterize(fig) -> bytes:
+    """Render a Matplotlib figure to PNG bytes and close it right away."""
+    import matplotlib.pyplot as plt
+
+    buffer = io.BytesIO()
+    try:
+        fig.savefig(buffer, **SAVEFIG_KWARGS)
+    finally:
+        plt.close(fig)
+    return buffer.getvalue()
+
+
+@st.cache_data(show_spinner=False, max_entries=MAX_CACHED_FIGURES)
+def _render_png(analysis: str, data_key: str, params: tuple, _draw) -> bytes:
+    # `_draw` is not hashed: the key is (analysis, data_key, params) only
+    return rasterize(_draw())
+
+
+def show_figure(analysis: str, draw, *data, **params):
+    """
+    Show the figure built by `draw()` (a function returning a Matplotlib figure).
+
+    The PNG is cached by analysis name, a fingerprint of `data` and `params`, so a
+    repeat skips Matplotlib entirely. On a miss the figure is closed as soon as it
+    is rasterized, so no Figure outlives the rerun.
+    """
+    with perf.stage("render"):
+        png = _render_png(analysis, fingerprint(*data), tuple(sorted(params.items())), draw)
+        st.image(png, use_container_width=True)
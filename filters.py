@@ -0,0 +1,130 @@
+# filters.py
+#
+# Sidebar filters (price range, rating range, release date window, discount flag)
+# answered from indexes built once per dataset version. Each range column is kept
+# as its row positions sorted by value, so a filter change finds the matching rows
+# with two binary searches per column and an intersection of the matches, instead
+# of comparing every row of the frame.
+
+from dataclasses import dataclass
+from datetime import date
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+import perf
+from charts import discount_mask
+from data_loader import SHARED_VERSIONS
+
+# Filter field -> the column it ranges over
+RANGE_COLUMNS = {"price": "price_eur", "rating": "rating_pct", "released": "release_date_parsed"}
+
+_EPOCH = pd.Timestamp(0)
+
+
+@dataclass(frozen=True)
+class Filters:
+    """
+    Active sidebar filters; None means the filter is off. Ranges are inclusive.
+    Rows without a value in a filtered column are left out.
+    """
+    price: tuple[float, float] | None = None
+    rating: tuple[float, float] | None = None
+    released: tuple[date, date] | None = None
+    discount: bool | None = None
+
+
+def _keys(s: pd.Series) -> np.ndarray:
+    # Dates are indexed as whole days since the epoch, everything else as floats
+    if pd.api.types.is_datetime64_any_dtype(s):
+        return (s - _EPOCH).dt.days.to_numpy(dtype=float, na_value=np.nan)
+    return s.to_numpy(dtype=float, na_value=np.nan)
+
+
+def _key(value, dtype) -> float:
+    if isinstance(value, date):
+        return float((pd.Timestamp(value) - _EPOCH).days)
+    # Rounded to the column's own precision, so a bound matches the stored value in a
+    # float32 column too (see compaction)
+    return float(np.asarray(value, dtype=dtype))
+
+
+class SortedIndex:
+    """Row positions of one column's values in ascending order of value; missing values are left out."""
+
+    def __init__(self, s: pd.Series):
+        keys = _keys(s)
+        present = np.flatnonzero(~np.isnan(keys))
+        self.order = present[np.argsort(keys[present], kind="stable")]
+        self.keys = keys[self.order]
+        self.dates = pd.api.types.is_datetime64_any_dtype(s)
+        self.dtype = s.dtype if pd.api.types.is_float_dtype(s) else np.float64
+
+    def bounds(self) -> tuple | None:
+        """Smallest and largest value (as dates for a date column), or None if there are none."""
+        if len(self.keys) == 0:
+            return None
+        if self.dates:
+            return tuple((_EPOCH + pd.Timedelta(days=k)).date() for k in (self.keys[0], self.keys[-1]))
+        # Shortest decimal that round-trips in the column's precision: 69.99, not 69.98999786
+        return tuple(float(str(np.asarray(k, dtype=self.dtype))) for k in (self.keys[0], self.keys[-1]))
+
+    def between(self, low, high) -> np.ndarray:
+        """Positions of the rows with low <= value <= high (unordered)."""
+        start = np.searchsorted(self.keys, _key(low, self.dtype), side="left")
+        end = np.searchsorted(self.keys, _key(high, self.dtype), side="right")
+        return self.order[start:end]
+
+
+class FilterIndex:
+    """The sorted indexes and discount partition of one dataset version."""
+
+    def __init__(self, df: pd.DataFrame):
+        self.rows = len(df)
+        self.ranges = {
+            field: SortedIndex(df[column]) for field, column in RANGE_COLUMNS.items() if column in df
+        }
+        self.discounted = None
+        if "has_discount" in df and "discount_in_price" in df:
+            flags = discount_mask(df).to_numpy()
+            self.discounted = {True: np.flatnonzero(flags), False: np.flatnonzero(~flags)}
+
+    def bounds(self, field: str) -> tuple | None:
+        index = self.ranges.get(field)
+        return index.bounds() if index else None
+
+    def select(self, filters: Filters) -> np.ndarray | None:
+        """
+        Positions (ascending) of the rows that pass `filters`, or None if no filter is
+        active. Filters on columns this dataset does not have are ignored.
+        """
+        matches = [
+            self.ranges[field].between(*getattr(filters, field))
+            for field in self.ranges
+            if getattr(filters, field) is not None
+        ]
+        if filters.discount is not None and self.discounted is not None:
+            matches.append(self.discounted[filters.discount])
+        if not matches:
+            return None
+
+        # Start from the smallest match; each other one only tests membership
+        matches.sort(key=len)
+        rows = matches[0]
+        for other in matches[1:]:
+            member = np.zeros(self.rows, dtype=bool)
+            member[other] = True
+            rows = rows[member[rows]]
+        return np.sort(rows)
+
+
+@st.cache_resource(show_spinner=False, max_entries=SHARED_VERSIONS)
+def filter_index(path: str, version: tuple[int, int], _df: pd.DataFrame) -> FilterIndex:
+    """
+    The FilterIndex of `_df`, the frame of `path` at `version`, built on first use and
+    shared across sessions.
+    """
+    # `_df` is not hashed: the frame is fixed by (path, version)
+    with perf.stage("index"):
+        return FilterIndex(_df)
@@ -1,8 +1,21 @@
 # parsers.py
 
+import functools
 import re
 import pandas as pd
 
+# Release date formats seen on SteamDB, tried in this order before format inference
+RELEASE_DATE_FORMATS = [
+    "%d %B %Y",
+    "%d %b, %Y",
+    "%Y-%m-%d",
+    "%b %d, %Y",
+    "%B %d, %Y",
+    "%B %Y",
+    "%b %Y",
+    "%Y",
+]
+
 def parse_followers(x):
     """
     Parse follower gain strings like "1,234+" or "5678" into integer.
@@ -81,3 +94,105 @@ def parse_release_date(x):
         return pd.to_datetime(x)
     except Exception:
         return None
+
+
+def _is_text(s):
+    """True if the Series can hold strings (object or string dtype)."""
+    return s.dtype == object or pd.api.types.is_string_dtype(s)
+
+def _per_category(parser):
+    """
+    Let a Series parser accept categorical columns by parsing each category once
+    and broadcasting the results through the codes.
+    """
+    @functools.wraps(parser)
+    def wrapper(s):
+        if not isinstance(s.dtype, pd.CategoricalDtype):
+            return parser(s)
+        # The trailing None is what code -1 (missing) picks up
+        values = parser(pd.Series([*s.cat.categories, None], dtype=object)).to_numpy()
+        return pd.Series(values.take(s.cat.codes.to_numpy()), index=s.index)
+    return wrapper
+
+@_per_category
+def parse_followers_series(s):
+    """
+    Vectorized parse_followers for a whole column.
+    Returns a numeric Series with NaN where parsing fails.
+    """
+    if not _is_text(s):
+        return pd.Series(float("nan"), index=s.index)
+    cleaned = s.str.replace(r"[^\d]", "", regex=True)
+    return pd.to_numeric(cleaned, errors="coerce")
+
+@_per_category
+def parse_price_series(s):
+    """
+    Vectorized parse_price for a whole column.
+    Returns a float Series of euros with NaN where parsing fails.
+    """
+    if not _is_text(s):
+        return pd.Series(float("nan"), index=s.index)
+    euro = s.str.contains("€", regex=False, na=False)
+    cleaned = s.where(euro).str.replace("€", "", regex=False).str.replace(",", ".", regex=False).str.strip()
+    result = pd.to_numeric(cleaned, errors="coerce").astype(float)
+    free = ~euro & s.str.strip().str.lower().eq("free").fillna(False).astype(bool)
+    return result.mask(free, 0.0)
+
+@_per_category
+def parse_rating_series(s):
+    """
+    Vectorized parse_rating for a whole column.
+    Returns a float Series with NaN where parsing fails.
+    """
+    if not _is_text(s):
+        return pd.Series(float("nan"), index=s.index)
+    pct = s.str.contains("%", regex=False, na=False)
+    cleaned = s.where(pct).str.replace("%", "", regex=False).str.replace(",", ".", regex=False).str.strip()
+    return pd.to_numeric(cleaned, errors="coerce").astype(float)
+
+@_per_category
+def parse_discount_series(s):
+    """
+    Vectorized parse_discount for a whole column.
+    Returns a bool Series, True where a "-20%"-style discount is present.
+    """
+    if not _is_text(s):
+        return pd.Series(False, index=s.index)
+    return s.str.contains(r"-\d+%", regex=True, na=False).astype(bool)
+
+@_per_category
+def parse_peak_series(s):
+    """
+    Vectorized parse_peak for a whole column.
+    Returns a numeric Series with NaN where no digits are found.
+    """
+    if not _is_text(s):
+        return pd.Series(float("nan"), index=s.index)
+    cleaned = s.str.replace(r"[^\d]", "", regex=True)
+    return pd.to_numeric(cleaned.where(cleaned != ""), errors="coerce")
+
+def parse_release_date_series(s):
+    """
+    Vectorized parse_release_date for a whole column. Each distinct value is parsed
+    once: strings are tried against RELEASE_DATE_FORMATS first, and whatever none of
+    them match goes through parse_release_date (format inference).
+    Returns a datetime64 Series with NaT where parsing fails.
+    """
+    codes, uniques = pd.factorize(s)
+    uniques = pd.Series(uniques, dtype=object)
+    # One slot past the uniques for code -1 (missing)
+    parsed = pd.Series(pd.NaT, index=range(len(uniques) + 1), dtype="datetime64[ns]")
+
+    pending = uniques[uniques.map(type) == str]
+    for fmt in RELEASE_DATE_FORMATS:
+        if pending.empty:
+            break
+        dates = pd.to_datetime(pending, format=fmt, errors="coerce")
+        found = dates.notna()
+        parsed[dates.index[found]] = dates[found]
+        pending = pending[~found]
+
+    for i in uniques.index.difference(parsed.index[parsed.notna()]):
+        parsed[i] = parse_release_date(uniques[i])
+    return pd.Series(parsed.to_numpy().take(codes), index=s.index)
@@ -0,0 +1,117 @@
+# perf.py
+#
+# Stage timings (load, parse, compute, render) for one analysis run.
+#
+#     with perf.run("Вигідність гри", enabled=True):
+#         with perf.stage("load") as s:
+#             df = load_main_csv()
+#             s["rows"] = len(df)
+#
+# Stages nest; each reports its time minus the time of the stages inside it, so a
+# "compute" stage that renders a figure reports compute and render separately.
+# With no run active (the default) a stage is a single attribute check.
+
+import contextlib
+import json
+import threading
+import time
+from collections import deque
+from datetime import datetime, timezone
+
+import pandas as pd
+import streamlit as st
+
+# Runs kept per session for the sidebar panel
+PERF_HISTORY = 20
+
+# Where finished runs are appended, one JSON object per line
+PERF_LOG_PATH = "perf_log.jsonl"
+
+_state = threading.local()
+_log_lock = threading.Lock()
+
+
+class _Run:
+    def __init__(self, analysis: str, **context):
+        self.analysis = analysis
+        self.context = context
+        self.stages = {}
+        self.stack = []
+        self.started = time.perf_counter()
+
+    def add(self, name: str, inclusive: float, children: float, info: dict):
+        stage = self.stages.setdefault(name, {"ms": 0.0})
+        stage["ms"] += (inclusive - children) * 1000
+        stage.update(info)
+
+    def record(self) -> dict:
+        return {
+            "ts": datetime.now(timezone.utc).isoformat(timespec="milliseconds"),
+            "analysis": self.analysis,
+            **self.context,
+            "total_ms": (time.perf_counter() - self.started) * 1000,
+            "stages": self.stages,
+        }
+
+
+def _current() -> _Run | None:
+    return getattr(_state, "run", None)
+
+
+@contextlib.contextmanager
+def run(analysis: str, enabled: bool = True, log_path: str | None = PERF_LOG_PATH, **context):
+    """
+    Time the stages of one analysis run. When it ends the record is added to this
+    session's history and appended to `log_path` as a JSON line.
+    Extra keyword arguments are stored with the record.
+    """
+    if not enabled:
+        yield
+        return
+    _state.run = _Run(analysis, **context)
+    try:
+        yield
+    finally:
+        finished, _state.run = _state.run, None
+        record = finished.record()
+        history = st.session_state.setdefault("perf_history", deque(maxlen=PERF_HISTORY))
+        history.append(record)
+        if log_path:
+            with _log_lock, open(log_path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+
+@contextlib.contextmanager
+def stage(name: str):
+    """
+    Time a stage of the active run. Yields a dict for extra facts about the stage
+    (for example `rows`). Repeated stages with the same name add up.
+    """
+    current = _current()
+    if current is None:
+        yield {}
+        return
+    info = {}
+    current.stack.append(0.0)
+    start = time.perf_counter()
+    try:
+        yield info
+    finally:
+        inclusive = time.perf_counter() - start
+        children = current.stack.pop()
+        if current.stack:
+            current.stack[-1] += inclusive
+        current.add(name, inclusive, children, info)
+
+
+def history_frame() -> pd.DataFrame:
+    """This session's recent runs, newest first, one column per stage in milliseconds."""
+    rows = []
+    for record in reversed(st.session_state.get("perf_history", ())):
+        row = {"analysis": record["analysis"], "total": record["total_ms"]}
+        for name, stage_info in record["stages"].items():
+            row[name] = stage_info["ms"]
+            if "rows" in stage_info:
+                row["rows"] = stage_info["rows"]
+        rows.append(row)
+    return pd.DataFrame(rows).round(1)
@@ -0,0 +1,214 @@
+# precompute.py
+#
+# Results of the registered analyses, shared across reruns and sessions.
+#
+# Once a dataset has been loaded, a background thread computes every analysis
+# registered for it with its default parameters, so switching the sidebar option
+# renders a stored result instead of starting the computation.
+#
+# The rankings and the price × rating cube several analyses share (see
+# charts.ranking_store, cube.PriceRatingCube) are kept here too, one per dataset
+# version; in incremental mode the cube is extended with the appended rows.
+
+import threading
+from collections import OrderedDict
+from datetime import date
+
+import pandas as pd
+import streamlit as st
+
+from charts import ranking_store
+from cube import PriceRatingCube
+from data_loader import SHARED_VERSIONS, incremental_csv
+from filters import Filters
+from ranking import RankingStore
+from registry import Analysis, for_dataset
+from tables import row_bytes
+
+# Estimated in-memory size of the computed results kept; the least recently used are
+# dropped first
+MAX_RESULT_BYTES = 512 * 2**20
+
+# Filtered results larger than this are recomputed rather than kept: with tables of
+# every matching row, one per filter combination would soon crowd out the rest
+MAX_FILTERED_RESULT_BYTES = 16 * 2**20
+
+# Returned by ResultStore.get when nothing is stored (None can be a valid result)
+MISSING = object()
+
+
+def result_bytes(result) -> int:
+    """Estimated in-memory size of the frames and series in `result` (dicts and tuples too)."""
+    if isinstance(result, pd.Series):
+        result = result.to_frame()
+    if isinstance(result, pd.DataFrame):
+        return int(row_bytes(result) * len(result)) + result.index.nbytes
+    if isinstance(result, dict):
+        return sum(map(result_bytes, result.values()))
+    if isinstance(result, (tuple, list)):
+        return sum(map(result_bytes, result))
+    return 0
+
+
+class ResultStore:
+    """
+    Thread-safe LRU map from result_key(...) to a computed analysis result, holding
+    at most `max_bytes` of results (see result_bytes).
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()
+        self.sizes = {}
+        self.bytes = 0
+        self.warmed = set()
+        self.lock = threading.Lock()
+
+    def get(self, key):
+        with self.lock:
+            if key not in self.entries:
+                return MISSING
+            self.entries.move_to_end(key)
+            return self.entries[key]
+
+    def put(self, key, result, max_bytes: int | None = None):
+        """Store `result`, unless it is larger than `max_bytes` or the whole store."""
+        size = result_bytes(result)
+        with self.lock:
+            self._drop(key)
+            if size > min(self.max_bytes, max_bytes or self.max_bytes):
+                return
+            self.entries[key] = result
+            self.sizes[key] = size
+            self.bytes += size
+            while self.bytes > self.max_bytes:
+                self._drop(next(iter(self.entries)))
+
+    def _drop(self, key):
+        if key in self.entries:
+            del self.entries[key]
+            self.bytes -= self.sizes.pop(key)
+
+    def claim(self, source) -> bool:
+        """True the first time `source` is claimed for a warm-up, False afterwards."""
+        with self.lock:
+            if source in self.warmed:
+                return False
+            self.warmed.add(source)
+            return True
+
+
+@st.cache_resource(show_spinner=False)
+def results() -> ResultStore:
+    """The process-wide result store."""
+    return ResultStore(MAX_RESULT_BYTES)
+
+
+def result_key(analysis: Analysis, path: str, version: tuple[int, int], params: dict,
+               filters: Filters = Filters()) -> tuple:
+    # Today's date is part of the key: launch analyses count days since release
+    return analysis.option, path, version, tuple(sorted(params.items())), filters, date.today()
+
+
+@st.cache_resource(show_spinner=False, max_entries=SHARED_VERSIONS)
+def _rankings(path: str, version: tuple[int, int], day: date, _df: pd.DataFrame) -> RankingStore:
+    # `_df` is not hashed: the frame is fixed by (path, version); `day` because
+    # launch rankings count days since release
+    return ranking_store(_df)
+
+
+@st.cache_resource(show_spinner=False, max_entries=SHARED_VERSIONS)
+def _cube(path: str, version: tuple[int, int], _df: pd.DataFrame) -> PriceRatingCube:
+    # `_df` is not hashed: the frame is fixed by (path, version)
+    return PriceRatingCube.build(_df)
+
+
+class _CubeFeed:
+    """
+    The cube of the latest frame of an IncrementalCSV, extended with the rows appended
+    since instead of rebuilt.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.lock = threading.Lock()
+        self.cube = None
+        self.generation = None
+        self.rows = 0
+
+    def current(self, df: pd.DataFrame, version: tuple[int, int]) -> PriceRatingCube:
+        """The cube of `df`, the frame at `version`."""
+        generation = incremental_csv(self.path).generation_of(version)
+        with self.lock:
+            if generation is None or generation != self.generation or len(df) < self.rows:
+                cube = PriceRatingCube.build(df)
+            elif len(df) > self.rows:
+                # A new cube rather than update(): sessions may be reading this one
+                cube = self.cube.merged(PriceRatingCube.build(df.iloc[self.rows:]))
+            else:
+                return self.cube
+            self.cube, self.generation, self.rows = cube, generation, len(df)
+            return cube
+
+
+@st.cache_resource(show_spinner=False)
+def _cube_feed(path: str) -> _CubeFeed:
+    return _CubeFeed(path)
+
+
+def shared(analysis: Analysis, path: str, version: tuple[int, int], df: pd.DataFrame,
+           incremental: bool = False, rows=None) -> dict:
+    """
+    The shared structures `analysis` reads (see charts.uses_rankings and uses_cube) for
+    `df`, the whole frame of `path` at `version`, as keyword arguments for its compute
+    step. They are built on first use and kept for every session. With `rows`
+    (positions from FilterIndex.select) they are for df.iloc[rows] instead: the shared
+    rankings restricted to those rows; a cube of them is left to the analysis.
+    """
+    found = {}
+    if analysis.ranked:
+        found["rankings"] = _rankings(path, version, date.today(), df)
+        if rows is not None:
+            found["rankings"] = found["rankings"].restricted(rows)
+    if analysis.cubed and rows is None:
+        found["cube"] = _cube_feed(path).current(df, version) if incremental else _cube(path, version, df)
+    return found
+
+
+def compute(analysis: Analysis, df: pd.DataFrame, params: dict, shared: dict | None = None):
+    """Run `analysis` on `df`, with `shared` structures of the same rows (see shared())."""
+    return analysis.compute(df, **(shared or {}), **params)
+
+
+def _warm(dataset: str, path: str, version: tuple[int, int], df: pd.DataFrame, incremental: bool):
+    store = results()
+    for analysis in for_dataset(dataset):
+        key = result_key(analysis, path, version, analysis.defaults)
+        if store.get(key) is not MISSING:
+            continue
+        try:
+            result = compute(
+                analysis,
+                df[[c for c in analysis.columns if c in df]],
+                analysis.defaults,
+                shared(analysis, path, version, df, incremental),
+            )
+        except Exception:
+            # Left for the foreground run, which reports the error to the user
+            continue
+        store.put(key, result)
+
+
+def start(dataset: str, path: str, version: tuple[int, int], df: pd.DataFrame, incremental: bool = False):
+    """
+    Precompute every analysis of `dataset` on `df`, its whole frame at `version`, in a
+    background thread, once per file version and day.
+    """
+    if not results().claim((dataset, path, version, date.today())):
+        return
+    threading.Thread(
+        target=_warm,
+        args=(dataset, path, version, df, incremental),
+        name=f"precompute-{dataset}",
+        daemon=True,
+    ).start()
@@ -0,0 +1,183 @@
+# ranking.py
+
+import threading
+
+import numpy as np
+import pandas as pd
+
+
+def _taken(df: pd.DataFrame, positions) -> pd.DataFrame:
+    # Rows copied out for display: counts stored as float32 (see compaction) are widened
+    # so tables and reports show the same values as the SQLite backend
+    rows = df.iloc[positions]
+    return rows.astype({c: np.float64 for c, dtype in rows.dtypes.items() if dtype == np.float32})
+
+
+def _ordered(df: pd.DataFrame, positions: np.ndarray, column: str | pd.Series, ascending: bool, k: int,
+             tie_breaker: str | None) -> pd.DataFrame:
+    """
+    Take the candidate rows at `positions` (the only rows copied out of `df`), add
+    `column` to them if it is a Series not in `df`, and sort by it, then by
+    `tie_breaker` (always ascending).
+    """
+    positions = np.sort(positions)
+    candidates = _taken(df, positions)
+    name = column if isinstance(column, str) else column.name
+    if name not in candidates:
+        candidates = candidates.assign(**{name: column.iloc[positions].to_numpy()})
+    if tie_breaker is None or tie_breaker not in candidates:
+        return candidates.sort_values(name, ascending=ascending, kind="stable").head(k)
+    return candidates.sort_values(
+        [name, tie_breaker], ascending=[ascending, True], kind="stable"
+    ).head(k)
+
+
+def _values(df: pd.DataFrame, column: str | pd.Series) -> tuple[np.ndarray, np.ndarray]:
+    """All values of `column` as floats, and the positions of those that are not NaN."""
+    series = df[column] if isinstance(column, str) else column
+    values = series.to_numpy(dtype=float, na_value=np.nan)
+    return values, np.flatnonzero(~np.isnan(values))
+
+
+def top_bottom_k(df: pd.DataFrame, column: str | pd.Series, k: int,
+                 tie_breaker: str | None = "name") -> tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Return (bottom, top): the k rows with the smallest `column` in ascending order
+    and the k rows with the largest in descending order.
+
+    `column` is a column of `df` or a named Series aligned with it: a metric derived
+    from other columns, added to the returned rows under its name, or a column of
+    `df` with the rows to skip set to NaN. Either way `df` itself is never filtered,
+    copied or modified; only the candidate rows are taken out of it.
+
+    Uses one partial selection (np.partition) over the column instead of full
+    sorts; only the rows at or beyond each cut-off are sorted. Ties are broken by
+    `tie_breaker` ascending, so results are stable across runs. Rows where
+    `column` is NaN are ignored.
+    """
+    values, present = _values(df, column)
+    n = len(present)
+    if k >= n:
+        return (
+            _ordered(df, present, column, True, k, tie_breaker),
+            _ordered(df, present, column, False, k, tie_breaker),
+        )
+    if k <= 0:
+        none = present[:0]
+        return (
+            _ordered(df, none, column, True, k, tie_breaker),
+            _ordered(df, none, column, False, k, tie_breaker),
+        )
+
+    partitioned = np.partition(values[present], [k - 1, n - k])
+    low, high = partitioned[k - 1], partitioned[n - k]
+    return (
+        _ordered(df, present[values[present] <= low], column, True, k, tie_breaker),
+        _ordered(df, present[values[present] >= high], column, False, k, tie_breaker),
+    )
+
+
+def top_k(df: pd.DataFrame, column: str | pd.Series, k: int, tie_breaker: str | None = "name") -> pd.DataFrame:
+    """
+    The k rows with the largest `column`, in descending order (see top_bottom_k).
+    """
+    values, present = _values(df, column)
+    n = len(present)
+    if k >= n:
+        return _ordered(df, present, column, False, k, tie_breaker)
+    if k <= 0:
+        return _ordered(df, present[:0], column, False, k, tie_breaker)
+    high = np.partition(values[present], n - k)[n - k]
+    return _ordered(df, present[values[present] >= high], column, False, k, tie_breaker)
+
+
+class RankingStore:
+    """
+    Derived metrics of one frame and their rankings, each computed on first use and
+    kept for later calls. `metrics` maps a metric name to a function of the frame
+    that returns it as a Series. Rankings are descending with ties broken by
+    `tie_breaker` ascending, like top_k; rows where the metric is NaN are not ranked.
+    Safe to share between threads.
+    """
+
+    def __init__(self, df: pd.DataFrame, metrics: dict, tie_breaker: str | None = "name"):
+        self.df = df
+        self.metrics = metrics
+        self.tie_breaker = tie_breaker
+        self._values = {}
+        self._orders = {}
+        self._lock = threading.RLock()
+
+    def values(self, metric: str) -> pd.Series:
+        """The metric for every row of the frame."""
+        with self._lock:
+            if metric not in self._values:
+                self._values[metric] = self.metrics[metric](self.df).rename(metric)
+            return self._values[metric]
+
+    def order(self, metric: str) -> np.ndarray:
+        """Positions of the ranked rows, best first."""
+        with self._lock:
+            if metric not in self._orders:
+                values = self.values(metric).to_numpy(dtype=float, na_value=np.nan)
+                present = np.flatnonzero(~np.isnan(values))
+                keys = pd.DataFrame({metric: values[present]})
+                by, ascending = [metric], [False]
+                if self.tie_breaker is not None and self.tie_breaker in self.df:
+                    keys[self.tie_breaker] = self.df[self.tie_breaker].to_numpy()[present]
+                    by, ascending = [metric, self.tie_breaker], [False, True]
+                ranked = keys.sort_values(by, ascending=ascending, kind="stable")
+                self._orders[metric] = present[ranked.index.to_numpy()]
+            return self._orders[metric]
+
+    def top(self, df: pd.DataFrame, metric: str, k: int | None = None, where=None) -> pd.DataFrame:
+        """
+        The best k ranked rows (all if k is None) of `df`, which is the store's frame or a
+        projection of it, best first. `where` (a boolean mask over the frame) limits
+        them to some rows. The metric is added to the rows if `df` lacks it.
+        Same rows and order as top_k on the metric with the other rows set to NaN.
+        """
+        order = self.order(metric)
+        if where is not None:
+            order = order[np.asarray(where, dtype=bool)[order]]
+        if k is not None:
+            order = order[:max(k, 0)]
+        rows = _taken(df, order)
+        if metric not in rows:
+            rows = rows.assign(**{metric: self.values(metric).to_numpy()[order]})
+        return rows
+
+    def restricted(self, rows: np.ndarray) -> "RankingStore":
+        """
+        The rankings of the rows at positions `rows` (ascending) of the frame, such as
+        the rows a sidebar filter keeps, for use with df.iloc[rows]. They are taken from
+        these rankings (computed here if needed and kept), not re-sorted.
+        """
+        return _RestrictedRankings(self, rows)
+
+
+class _RestrictedRankings(RankingStore):
+    # Everything is derived from the parent's rankings; the rows themselves are never
+    # taken out of the frame
+    def __init__(self, parent: RankingStore, rows: np.ndarray):
+        super().__init__(None, parent.metrics, parent.tie_breaker)
+        self.parent = parent
+        self.rows = rows
+        self._positions = None
+
+    def values(self, metric: str) -> pd.Series:
+        with self._lock:
+            if metric not in self._values:
+                self._values[metric] = self.parent.values(metric).iloc[self.rows]
+            return self._values[metric]
+
+    def order(self, metric: str) -> np.ndarray:
+        with self._lock:
+            if metric not in self._orders:
+                if self._positions is None:
+                    # Position of each frame row among `rows`, -1 for the rows left out
+                    self._positions = np.full(len(self.parent.df), -1)
+                    self._positions[self.rows] = np.arange(len(self.rows))
+                ranked = self._positions[self.parent.order(metric)]
+                self._orders[metric] = ranked[ranked >= 0]
+            return self._orders[metric]
@@ -0,0 +1,109 @@
+# registry.py
+#
+# Every analysis the app offers, declared once: which dataset it runs on, the
+# columns it reads, a pure compute step and the render step that shows its result.
+
+from dataclasses import dataclass, field
+from typing import Callable
+
+import charts
+import sql_backend
+import streaming
+
+
+@dataclass(frozen=True)
+class Analysis:
+    """
+    One sidebar option. `compute(df, **params)` returns a result that `render(result)`
+    shows; `controls(rows)` (optional) draws widgets and returns the params, otherwise
+    `defaults` are used. `stream(path)` (optional) runs it chunk by chunk, and
+    `sql(db, **params)` (optional) computes the same result with SQLite queries.
+    """
+    option: str
+    dataset: str
+    compute: Callable
+    render: Callable
+    controls: Callable | None = None
+    defaults: dict = field(default_factory=dict)
+    stream: Callable | None = None
+    sql: Callable | None = None
+
+    @property
+    def columns(self) -> tuple[str, ...]:
+        return self.compute.columns
+
+    @property
+    def ranked(self) -> bool:
+        """True if `compute` takes a shared `rankings` store (see charts.uses_rankings)."""
+        return getattr(self.compute, "ranked", False)
+
+    @property
+    def cubed(self) -> bool:
+        """True if `compute` takes a shared price × rating `cube` (see charts.uses_cube)."""
+        return getattr(self.compute, "cubed", False)
+
+
+REGISTRY = [
+    Analysis(
+        "Вплив знижки на приріст уваги", "main",
+        charts.compute_discount_analysis, charts.render_discount_analysis,
+        stream=streaming.stream_discount_analysis,
+    ),
+    Analysis(
+        "Ціна гри vs приріст уваги", "main",
+        charts.compute_price_vs_gain, charts.render_price_vs_gain,
+        controls=charts.price_vs_gain_controls, defaults={"top_n": 100},
+        sql=sql_backend.sql_price_vs_gain,
+    ),
+    Analysis(
+        "Сегментація за ціною та рейтингом", "main",
+        charts.compute_segmentation, charts.render_segmentation,
+        stream=streaming.stream_segmentation,
+        sql=sql_backend.sql_segmentation,
+    ),
+    Analysis(
+        "Чи рятує знижка погані ігри", "main",
+        charts.compute_discount_rescue, charts.render_discount_rescue,
+        sql=sql_backend.sql_discount_rescue,
+    ),
+    Analysis(
+        "Вигідність гри", "main",
+        charts.compute_value_analysis, charts.render_value_analysis,
+        stream=streaming.stream_value_analysis,
+        sql=sql_backend.sql_value_analysis,
+    ),
+    Analysis(
+        "Переоцінені й недооцінені ігри", "main",
+        charts.compute_over_under_rated, charts.render_over_under_rated,
+        sql=sql_backend.sql_over_under_rated,
+    ),
+    Analysis(
+        "Неочікувані хіти з малим фоловом", "upcoming",
+        charts.compute_unexpected_hits, charts.render_unexpected_hits,
+        sql=sql_backend.sql_unexpected_hits,
+    ),
+    Analysis(
+        "Потенціал зростання гри", "main",
+        charts.compute_growth_potential, charts.render_growth_potential,
+        sql=sql_backend.sql_growth_potential,
+    ),
+    Analysis(
+        "Нестандарт рейтинг + ціна vs онлайн", "upcoming",
+        charts.compute_heatmap_rating_price, charts.render_heatmap_rating_price,
+        sql=sql_backend.sql_heatmap_rating_price,
+    ),
+    Analysis(
+        "Ефективність запуску гри", "main",
+        charts.compute_launch_efficiency, charts.render_launch_efficiency,
+        stream=streaming.stream_launch_efficiency,
+        sql=sql_backend.sql_launch_efficiency,
+    ),
+]
+
+# Analyses keyed by their sidebar option
+ANALYSES = {analysis.option: analysis for analysis in REGISTRY}
+
+
+def for_dataset(dataset: str) -> list[Analysis]:
+    """Registered analyses that run on `dataset` ("main" or "upcoming")."""
+    return [analysis for analysis in REGISTRY if analysis.dataset == dataset]
@@ -0,0 +1,191 @@
+# report.py
+#
+# Run every registered analysis headless and write its tables and charts to a directory:
+#
+#     python report.py --main steamdb.csv --upcoming steamdb_upcoming.csv --output reports/
+#
+# Each analysis is computed and rendered in its own worker process, so Matplotlib
+# rendering runs in parallel instead of queueing behind the GIL. For every analysis
+# the output directory gets <name>.png (one per figure), <name>_<n>.csv and .json
+# (one per table) and a manifest.json listing all of them.
+
+import argparse
+import contextlib
+import json
+import multiprocessing
+import os
+import sys
+import time
+import warnings
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import pandas as pd
+import streamlit as st
+import streamlit.logger
+
+# Before the analysis modules load: outside a server every st.cache_* decorator warns
+streamlit.logger.set_log_level("error")
+
+import charts
+import data_loader
+import figures
+from registry import ANALYSES, REGISTRY, Analysis
+
+
+def quiet():
+    """Silence the chatter of running analyses outside a Streamlit server."""
+    warnings.filterwarnings("ignore", category=pd.errors.SettingWithCopyWarning)
+    warnings.filterwarnings("ignore", category=FutureWarning)
+
+
+@contextlib.contextmanager
+def captured_output():
+    """
+    Record what an analysis shows instead of sending it to Streamlit: tables (titled by
+    the subheader before them), figure draw() callbacks, warnings and captions.
+    Yields the dict they are collected in.
+    """
+    output = {"tables": [], "figures": [], "notes": []}
+    title = [None]
+    saved = {name: getattr(st, name) for name in ("subheader", "dataframe", "warning", "caption")}
+    saved_show = charts.show_figure
+    saved_table = charts.show_table
+    try:
+        st.subheader = lambda text, *args, **kwargs: title.__setitem__(0, text)
+        st.dataframe = lambda data, *args, **kwargs: output["tables"].append((title[0], data))
+        st.warning = st.caption = lambda text, *args, **kwargs: output["notes"].append(text)
+        charts.show_figure = lambda analysis, draw, *data, **params: output["figures"].append(draw)
+        # Whole tables, not the page the app would show
+        charts.show_table = lambda table, data, *args, **kwargs: output["tables"].append((title[0], data))
+        yield output
+    finally:
+        for name, fn in saved.items():
+            setattr(st, name, fn)
+        charts.show_figure = saved_show
+        charts.show_table = saved_table
+
+
+def report_name(analysis: Analysis) -> str:
+    """File name stem for an analysis: render_value_analysis -> value_analysis."""
+    return analysis.render.__name__.removeprefix("render_")
+
+
+def run_analysis(option: str, path: str, version: tuple[int, int], output_dir: str) -> dict:
+    """
+    Compute and render one analysis with its default parameters and write its files.
+    Runs in a worker process; returns the manifest entry.
+    """
+    import matplotlib
+
+    matplotlib.use("Agg")
+    quiet()
+
+    started = time.perf_counter()
+    analysis = ANALYSES[option]
+    name = report_name(analysis)
+    df = data_loader.read_normalized(path, version, analysis.columns)
+    result = analysis.compute(df, **analysis.defaults)
+    with captured_output() as output:
+        analysis.render(result)
+
+    files = {"tables": [], "figures": []}
+    for n, (title, table) in enumerate(output["tables"], start=1):
+        stem = os.path.join(output_dir, f"{name}_{n}")
+        table = pd.DataFrame(table)
+        table.to_csv(stem + ".csv", index=False)
+        table.to_json(stem + ".json", orient="records", force_ascii=False, date_format="iso", indent=2)
+        files["tables"].append({"title": title, "csv": stem + ".csv", "json": stem + ".json", "rows": len(table)})
+    for n, draw in enumerate(output["figures"], start=1):
+        png = os.path.join(output_dir, f"{name}.png" if len(output["figures"]) == 1 else f"{name}_{n}.png")
+        with open(png, "wb") as f:
+            f.write(figures.rasterize(draw()))
+        files["figures"].append(png)
+
+    return {
+        "option": option,
+        "dataset": analysis.dataset,
+        "source": path,
+        "notes": output["notes"],
+        **files,
+        "seconds": round(time.perf_counter() - started, 3),
+    }
+
+
+def prepare(paths: dict[str, str]) -> dict[str, tuple[int, int]]:
+    """
+    Parse each dataset once in this process so its Parquet sidecar is fresh and the
+    workers only read it. Returns the file version of each path.
+    """
+    versions = {}
+    for dataset, path in paths.items():
+        versions[dataset] = data_loader.file_version(path)
+        data_loader.read_normalized(path, versions[dataset])
+    return versions
+
+
+def build_report(paths: dict[str, str], output_dir: str, jobs: int | None = None) -> dict:
+    """
+    Run every registered analysis whose dataset is in `paths` ({"main": csv, "upcoming": csv})
+    across `jobs` worker processes (all CPUs by default) and write the report to `output_dir`.
+    Returns the manifest, which is also saved as manifest.json.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    started = time.perf_counter()
+    versions = prepare(paths)
+    analyses = [analysis for analysis in REGISTRY if analysis.dataset in paths]
+
+    entries, failures = {}, {}
+    # spawn: workers must not inherit Streamlit's threads or a half-initialised Matplotlib
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=jobs, mp_context=context) as pool:
+        futures = {
+            pool.submit(
+                run_analysis, analysis.option, paths[analysis.dataset], versions[analysis.dataset], output_dir
+            ): analysis.option
+            for analysis in analyses
+        }
+        for future in as_completed(futures):
+            option = futures[future]
+            try:
+                entries[option] = future.result()
+            except Exception as e:
+                failures[option] = f"{type(e).__name__}: {e}"
+
+    manifest = {
+        "sources": paths,
+        "workers": jobs or os.cpu_count(),
+        "seconds": round(time.perf_counter() - started, 3),
+        "analyses": [entries[a.option] for a in analyses if a.option in entries],
+        "failed": failures,
+    }
+    with open(os.path.join(output_dir, "manifest.json"), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, ensure_ascii=False)
+    return manifest
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Write every analysis as static PNG, CSV and JSON files.")
+    parser.add_argument("--main", default=data_loader.MAIN_CSV_PATH, help="main SteamDB CSV")
+    parser.add_argument("--upcoming", default=data_loader.UPCOMING_CSV_PATH, help="upcoming releases CSV")
+    parser.add_argument("--output", default="reports", help="directory to write the report to")
+    parser.add_argument("--jobs", type=int, help="worker processes (default: number of CPUs)")
+    args = parser.parse_args()
+    quiet()
+
+    paths = {"main": args.main, "upcoming": args.upcoming}
+    missing = [path for path in paths.values() if not os.path.exists(path)]
+    if missing:
+        print(f"CSV file not found: {', '.join(missing)}", file=sys.stderr)
+        return 1
+
+    manifest = build_report(paths, args.output, args.jobs)
+    for entry in manifest["analyses"]:
+        print(f"{entry['seconds']:8.2f}s  {entry['option']}")
+    for option, error in manifest["failed"].items():
+        print(f"  failed  {option}: {error}", file=sys.stderr)
+    print(f"{manifest['seconds']:8.2f}s  total, {manifest['workers']} workers -> {args.output}")
+    return 1 if manifest["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,5 +1,6 @@
 import streamlit as st
 from constants import OPTIONS
+from filters import Filters
 
 def select_category():
     return st.sidebar.radio("🔍 Оберіть аналітичну категорію:", OPTIONS)
@@ -15,4 +16,100 @@ def get_selected_option(options, label="🔍 Оберіть аналітичну
     Returns:
     - selected option (str)
     """
-    return st.sidebar.radio(label, options)
\ No newline at end of file
+    return st.sidebar.radio(label, options)
+
+def get_streaming_mode(label="🌊 Потоковий режим (великі файли)"):
+    """
+    Render a sidebar checkbox for chunked, bounded-memory execution.
+
+    Returns:
+    - True if analyses that support it should stream the CSV (bool)
+    """
+    return st.sidebar.checkbox(
+        label,
+        help="Читає CSV частинами; таблиці обмежуються топ-рядками.",
+    )
+
+def get_incremental_mode(label="🔄 Підхоплювати нові рядки CSV"):
+    """
+    Render a sidebar checkbox for incremental ingestion of rows the scraper appends.
+
+    Returns:
+    - True if loads should parse only the appended tail of the CSV (bool)
+    """
+    return st.sidebar.checkbox(
+        label,
+        help="Дочитує лише дописані рядки; якщо файл перезаписано — перечитує повністю.",
+    )
+
+def get_sql_backend(label="🗄️ SQLite-бекенд (індексовані запити)"):
+    """
+    Render a sidebar checkbox that runs analyses as indexed SQLite queries where supported.
+
+    Returns:
+    - True if analyses with an SQL version should use it (bool)
+    """
+    return st.sidebar.checkbox(
+        label,
+        help="Фільтри, сортування й групування виконує SQLite; у pandas потрапляють лише рядки для показу.",
+    )
+
+def _range_filter(label, bounds, **kwargs):
+    # A slider left at the data's full extent is off, so rows without a value stay in
+    if bounds is None or bounds[0] == bounds[1]:
+        return None
+    selected = st.slider(label, bounds[0], bounds[1], bounds, **kwargs)
+    return None if tuple(selected) == tuple(bounds) else tuple(selected)
+
+def get_filters(index):
+    """
+    Render sidebar filters for price, rating, release date and discount, with slider
+    ranges taken from the dataset.
+
+    Parameters:
+    - index: filters.FilterIndex of the loaded dataset
+
+    Returns:
+    - filters.Filters with the filters the user narrowed
+    """
+    with st.sidebar.expander("🎚️ Фільтри", expanded=False):
+        price = _range_filter("💶 Ціна, €", index.bounds("price"))
+        rating = _range_filter("⭐ Рейтинг, %", index.bounds("rating"))
+        released = _range_filter("📅 Дата релізу", index.bounds("released"))
+        discount = {"Усі": None, "Зі знижкою": True, "Без знижки": False}[
+            st.radio("🏷️ Знижка", ["Усі", "Зі знижкою", "Без знижки"], horizontal=True)
+        ]
+    return Filters(price=price, rating=rating, released=released, discount=discount)
+
+def get_perf_panel(label="⏱️ Показати заміри продуктивності"):
+    """
+    Render a sidebar checkbox that turns on stage timing (see perf.py).
+
+    Returns:
+    - True if runs should be timed and the panel shown (bool)
+    """
+    return st.sidebar.checkbox(label)
+
+def show_perf_panel(history):
+    """
+    Show recent stage timings in the sidebar.
+
+    Parameters:
+    - history: DataFrame from perf.history_frame(), one row per run
+    """
+    with st.sidebar.expander("⏱️ Останні заміри, мс", expanded=True):
+        st.dataframe(history, hide_index=True)
+
+def show_memory_panel(report):
+    """
+    Show per-column memory of the loaded dataset before and after compaction in the sidebar.
+
+    Parameters:
+    - report: DataFrame from compaction.memory_report, one row per column plus "total"
+    """
+    mib = report.assign(
+        bytes_before=report["bytes_before"] / 2**20,
+        bytes_after=report["bytes_after"] / 2**20,
+    ).rename(columns={"bytes_before": "MiB до", "bytes_after": "MiB після"})
+    with st.sidebar.expander("🧠 Пам'ять датасету, MiB"):
+        st.dataframe(mib.round(2))
@@ -0,0 +1,175 @@
+# sketch.py
+#
+# Mergeable quantile sketch for distributions too large to keep in memory. Values are
+# counted exactly while there are at most EXACT_DISTINCT distinct ones (follower
+# counts and peaks are integers, so most cells and many whole datasets stay exact);
+# past that they are compacted (KLL: Karnin, Lang, Liberty, "Optimal Quantile
+# Approximation in Streams", 2016) into a few times K values whatever the input size.
+# Sketches built per chunk or per partition merge into a sketch of the whole with the
+# same error bound.
+
+import numpy as np
+
+# Size parameter of the compacted sketch: the rank error of a quantile is about 0.2%
+# of the count at K = 2000 (99% confidence) and falls as 1 / K
+K = 2_000
+
+# Distinct values counted exactly before the sketch starts compacting
+EXACT_DISTINCT = 2**15
+
+# Compaction offsets are drawn from a fixed seed, so the same input gives the same sketch
+SEED = 0
+
+
+class QuantileSketch:
+    """
+    Approximate distribution of the numbers added to it. Distinct values and their
+    counts are kept exactly up to EXACT_DISTINCT of them. Past that, values are kept
+    in levels; a value at level h stands for 2**h inputs. When the sketch outgrows
+    its capacity the lowest full level is sorted and every other value, from a random
+    offset, moves up a level, which shifts any rank by at most that level's weight.
+    Count, sum, min and max are kept exactly.
+    """
+
+    def __init__(self, k: int = K):
+        self.k = k
+        # Sorted distinct values and their counts; None once compacting
+        self.values = np.empty(0)
+        self.counts = np.zeros(0, dtype=np.int64)
+        self.levels = [np.empty(0)]
+        self.count = 0
+        self.sum = 0.0
+        self.min = np.inf
+        self.max = -np.inf
+        self._rng = np.random.default_rng(SEED)
+
+    @property
+    def exact(self) -> bool:
+        """True while every value is counted exactly."""
+        return self.counts is not None
+
+    def _capacity(self, level: int) -> int:
+        # The top level holds k values, each one below two thirds of the one above
+        depth = len(self.levels) - level - 1
+        return max(int(np.ceil(self.k * (2 / 3) ** depth)), 2)
+
+    def _compress(self):
+        while sum(map(len, self.levels)) > sum(self._capacity(h) for h in range(len(self.levels))):
+            level = next(h for h, items in enumerate(self.levels) if len(items) >= self._capacity(h))
+            if level + 1 == len(self.levels):
+                self.levels.append(np.empty(0))
+            items = np.sort(self.levels[level])
+            # With an odd count the smallest value stays behind
+            odd = len(items) % 2
+            self.levels[level] = items[:odd]
+            promoted = items[odd + self._rng.integers(2)::2]
+            self.levels[level + 1] = np.concatenate([self.levels[level + 1], promoted])
+
+    def _add(self, values: np.ndarray, counts: np.ndarray):
+        # `values` seen `counts` times each: counted exactly while few enough, then
+        # compacted together with what was counted so far
+        if len(values) == 0:
+            return
+        if self.exact:
+            values, inverse = np.unique(np.concatenate([self.values, values]), return_inverse=True)
+            counts = np.bincount(inverse, weights=np.concatenate([self.counts, counts])).astype(np.int64)
+            if len(values) <= EXACT_DISTINCT:
+                self.values, self.counts = values, counts
+                return
+            self.values = self.counts = None
+        # A value seen c times goes to each level h whose weight 2**h is a bit of c
+        for h in range(int(counts.max()).bit_length()):
+            if h == len(self.levels):
+                self.levels.append(np.empty(0))
+            self.levels[h] = np.concatenate([self.levels[h], values[(counts >> h) & 1 == 1]])
+        self._compress()
+
+    def update(self, values):
+        """Add `values` (an array or Series); NaN is skipped."""
+        values = np.asarray(values, dtype=float)
+        values = values[~np.isnan(values)]
+        if len(values) == 0:
+            return
+        self.count += len(values)
+        self.sum += float(values.sum())
+        self.min = min(self.min, float(values.min()))
+        self.max = max(self.max, float(values.max()))
+        self._add(values, np.ones(len(values), dtype=np.int64))
+
+    def merged(self, other: "QuantileSketch") -> "QuantileSketch":
+        result = QuantileSketch(max(self.k, other.k))
+        if not (self.exact and other.exact):
+            result.values = result.counts = None
+            result.levels = [
+                np.concatenate([s.levels[h] for s in (self, other) if h < len(s.levels)])
+                for h in range(max(len(self.levels), len(other.levels)))
+            ]
+        for s in (self, other):
+            if s.exact:
+                result._add(s.values, s.counts)
+        result.count = self.count + other.count
+        result.sum = self.sum + other.sum
+        result.min = min(self.min, other.min)
+        result.max = max(self.max, other.max)
+        result._compress()
+        return result
+
+    def _weighted(self) -> tuple[np.ndarray, np.ndarray]:
+        # Kept values in ascending order with their cumulative weights
+        if self.exact:
+            return self.values, np.cumsum(self.counts)
+        values = np.concatenate(self.levels)
+        weights = np.concatenate([np.full(len(items), 2**h, dtype=np.int64) for h, items in enumerate(self.levels)])
+        order = np.argsort(values, kind="stable")
+        return values[order], np.cumsum(weights[order])
+
+    def quantile(self, q: float) -> float:
+        """
+        Series.quantile(q) of the values added (linear interpolation): exact while
+        the values are counted exactly, within the rank error after. NaN if empty.
+        """
+        values, cumulative = self._weighted()
+        if len(values) == 0:
+            return float("nan")
+        position = (cumulative[-1] - 1) * q
+        lower, upper = np.floor(position), np.ceil(position)
+        lo = values[np.searchsorted(cumulative, lower, side="right")]
+        hi = values[np.searchsorted(cumulative, upper, side="right")]
+        return float(np.clip(lo + (hi - lo) * (position - lower), self.min, self.max))
+
+    def below(self, limit: float) -> "QuantileSketch":
+        """A sketch of the values below `limit` (count and sum estimated once compacted)."""
+        result = QuantileSketch(self.k)
+        if self.exact:
+            kept = self.values < limit
+            result.values, result.counts = self.values[kept], self.counts[kept]
+        else:
+            result.values = result.counts = None
+            result.levels = [items[items < limit] for items in self.levels]
+        values, cumulative = result._weighted()
+        weights = np.diff(cumulative, prepend=0)
+        result.count = int(cumulative[-1]) if len(values) else 0
+        result.sum = float(np.dot(values, weights))
+        if len(values):
+            result.min = self.min if self.min < limit else float(values[0])
+            result.max = float(values[-1])
+        return result
+
+    def boxplot_stats(self, whis: float = 1.5) -> dict:
+        """
+        Box and whisker statistics as matplotlib's cbook.boxplot_stats computes them,
+        from the kept values (and the exact min and max). Fliers are distinct values.
+        """
+        values = np.unique(np.concatenate([self._weighted()[0], [self.min, self.max]]))
+        q1, med, q3 = (self.quantile(q) for q in (0.25, 0.5, 0.75))
+        iqr = q3 - q1
+        inside = values[(values >= q1 - whis * iqr) & (values <= q3 + whis * iqr)]
+        return {
+            "med": med,
+            "q1": q1,
+            "q3": q3,
+            "whislo": inside.min() if len(inside) else q1,
+            "whishi": inside.max() if len(inside) else q3,
+            "fliers": values[(values < q1 - whis * iqr) | (values > q3 + whis * iqr)],
+            "mean": self.sum / self.count,
+        }
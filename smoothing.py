@@ -0,0 +1,71 @@
+# smoothing.py
+
+import numpy as np
+
+
+def _local_linear(cx, cy, weights, distance, radius) -> np.ndarray:
+    # Tricube weights scaled by `weights`, then weighted least squares per centre
+    u = np.clip(distance / radius[:, None], 0, 1)
+    w = (1 - u ** 3) ** 3 * weights[None, :]
+    s0 = w.sum(axis=1)
+    s1 = w @ cx
+    s2 = w @ cx ** 2
+    t0 = w @ cy
+    t1 = w @ (cx * cy)
+    denominator = s0 * s2 - s1 ** 2
+    flat = np.abs(denominator) <= 1e-12 * np.maximum(s0 * s2, 1e-300)
+    slope = np.where(flat, 0.0, (s0 * t1 - s1 * t0) / np.where(flat, 1.0, denominator))
+    return (t0 - slope * s1) / np.maximum(s0, 1e-300) + slope * cx
+
+
+def binned_lowess(x, y, frac: float = 0.3, bins: int = 200, it: int = 3) -> np.ndarray:
+    """
+    Approximate LOWESS trend line whose cost stays bounded as the number of points grows.
+
+    Points are first averaged into `bins` equal-width bins along x (one O(n) pass),
+    then a tricube-weighted local linear regression is fitted at each bin centre,
+    using the nearest bins that hold `frac` of all points (O(bins²)).
+    Like statsmodels' lowess, `it` robustness passes follow: each point gets a bisquare
+    weight from its residual to the curve (6 median absolute residuals or more weigh
+    nothing) and the bins are refitted from the reweighted points, so outliers pull
+    the curve as little as in the exact fit.
+    Returns an array of (x, smoothed y) rows sorted by x, like statsmodels' lowess.
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    finite = np.isfinite(x) & np.isfinite(y)
+    x, y = x[finite], y[finite]
+    if len(x) == 0:
+        return np.empty((0, 2))
+    lo, hi = x.min(), x.max()
+    if lo == hi:
+        return np.array([[lo, y.mean()]])
+
+    # Per-bin counts and centroids
+    index = np.minimum(((x - lo) / (hi - lo) * bins).astype(int), bins - 1)
+    counts = np.bincount(index, minlength=bins).astype(float)
+    filled = counts > 0
+    counts = counts[filled]
+    cx = np.bincount(index, weights=x, minlength=bins)[filled] / counts
+    cy = np.bincount(index, weights=y, minlength=bins)[filled] / counts
+
+    # Neighbourhood radius of each centre: distance that covers `frac` of the points
+    distance = np.abs(cx[:, None] - cx[None, :])
+    order = np.argsort(distance, axis=1)
+    covered = np.cumsum(counts[order], axis=1)
+    reach = np.argmax(covered >= frac * counts.sum(), axis=1)
+    radius = np.take_along_axis(distance, order, axis=1)[np.arange(len(cx)), reach]
+    radius = np.maximum(radius, np.finfo(float).eps) * 1.000001
+
+    fitted = _local_linear(cx, cy, counts, distance, radius)
+    for _ in range(it):
+        residuals = y - np.interp(x, cx, fitted)
+        scale = np.median(np.abs(residuals))
+        if scale <= 0:
+            break
+        robust = (1 - np.clip(residuals / (6 * scale), -1, 1) ** 2) ** 2
+        weights = np.bincount(index, weights=robust, minlength=bins)[filled]
+        sums = np.bincount(index, weights=robust * y, minlength=bins)[filled]
+        cy = np.where(weights > 0, sums / np.where(weights > 0, weights, 1), 0.0)
+        fitted = _local_linear(cx, cy, weights, distance, radius)
+    return np.column_stack([cx, fitted])
@@ -0,0 +1,167 @@
+# snapshots.py
+#
+# History of the main export. followers is a 7-day gain at the moment of the export,
+# so each new steamdb.csv replaces the last one; this keeps every parsed export as a
+# Parquet file in a date-partitioned directory:
+#
+#     steamdb_snapshots/snapshot_date=2026-10-18/part-0.parquet
+#
+# Rows are sorted by name in small row groups, so reading a few games only opens the
+# row groups whose name range can hold them, and a date range only opens its partitions.
+#
+#     python snapshots.py save steamdb.csv
+#     python snapshots.py history --top 1000 --last 90 --output history.csv
+
+import argparse
+import os
+import sys
+from datetime import date, datetime
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+from ranking import top_k
+
+# Columns of the normalized dataset kept per snapshot, with fixed types: the loaded
+# frame's compacted types (see compaction.compact) depend on each export's values,
+# and every partition of the dataset must share one schema
+SNAPSHOT_SCHEMA = pa.schema([
+    ("name", pa.string()),
+    ("followers_gain", pa.float64()),
+    ("price_eur", pa.float64()),
+    ("rating_pct", pa.float64()),
+    ("peak", pa.float64()),
+    ("has_discount", pa.bool_()),
+    ("discount_in_price", pa.bool_()),
+])
+SNAPSHOT_COLUMNS = SNAPSHOT_SCHEMA.names
+
+# Rows per Parquet row group; smaller groups let name lookups skip more of each file
+SNAPSHOT_ROW_GROUP = 16_384
+
+PARTITION_KEY = "snapshot_date"
+
+_PARTITIONING = ds.partitioning(pa.schema([(PARTITION_KEY, pa.string())]), flavor="hive")
+
+
+def snapshot_dir(path: str) -> str:
+    """Snapshot store kept next to a CSV: .../steamdb.csv -> .../steamdb_snapshots/."""
+    return os.path.splitext(path)[0] + "_snapshots"
+
+
+def save_snapshot(df: pd.DataFrame, root: str, taken: date | None = None) -> str:
+    """
+    Save a normalized export as the snapshot for `taken` (today by default), replacing
+    an earlier snapshot of the same day. Returns the written file.
+    """
+    taken = taken or date.today()
+    partition = os.path.join(root, f"{PARTITION_KEY}={taken.isoformat()}")
+    os.makedirs(partition, exist_ok=True)
+
+    columns = [c for c in SNAPSHOT_COLUMNS if c in df]
+    schema = pa.schema([SNAPSHOT_SCHEMA.field(c) for c in columns])
+    table = pa.Table.from_pandas(df[columns].sort_values("name", kind="stable"), schema=schema, preserve_index=False)
+    target = os.path.join(partition, "part-0.parquet")
+    tmp = target + ".tmp"
+    pq.write_table(table, tmp, row_group_size=SNAPSHOT_ROW_GROUP)
+    os.replace(tmp, target)
+    return target
+
+
+def snapshot_dates(root: str) -> list[str]:
+    """Dates (YYYY-MM-DD) with a snapshot, oldest first. Reads directory names only."""
+    if not os.path.isdir(root):
+        return []
+    prefix = f"{PARTITION_KEY}="
+    return sorted(
+        entry[len(prefix):]
+        for entry in os.listdir(root)
+        if entry.startswith(prefix) and os.path.exists(os.path.join(root, entry, "part-0.parquet"))
+    )
+
+
+def _dataset(root: str) -> ds.Dataset:
+    # Read under the fixed schema: partitions saved before it was fixed may store the
+    # counts as narrower integers, which are widened on read
+    schema = pa.schema([*SNAPSHOT_SCHEMA, pa.field(PARTITION_KEY, pa.string())])
+    return ds.dataset(root, schema=schema, format="parquet", partitioning=_PARTITIONING, exclude_invalid_files=True)
+
+
+def read_history(
+    root: str,
+    names: list[str] | None = None,
+    columns: tuple[str, ...] = ("followers_gain",),
+    last: int | None = None,
+    start: str | None = None,
+    end: str | None = None,
+) -> pd.DataFrame:
+    """
+    Long table of (snapshot_date, name, *columns) for the games in `names` (all games
+    if None), over the last `last` snapshots and/or snapshot dates in [start, end].
+    Only the matching partitions, row groups and columns are read.
+    """
+    dates = [d for d in snapshot_dates(root) if (start is None or d >= start) and (end is None or d <= end)]
+    if last is not None:
+        dates = dates[-last:] if last > 0 else []
+    if not dates:
+        return pd.DataFrame(columns=[PARTITION_KEY, "name", *columns])
+
+    condition = ds.field(PARTITION_KEY).isin(dates)
+    if names is not None:
+        condition &= ds.field("name").isin(list(names))
+    table = _dataset(root).to_table(columns=[PARTITION_KEY, "name", *columns], filter=condition)
+    return table.to_pandas().sort_values([PARTITION_KEY, "name"], kind="stable", ignore_index=True)
+
+
+def top_history(root: str, n: int = 1000, last: int = 90, column: str = "followers_gain") -> pd.DataFrame:
+    """
+    `column` over the last `last` snapshots for the `n` games ranked highest by it in
+    the latest snapshot: one row per snapshot date, one column per game.
+    """
+    dates = snapshot_dates(root)
+    if not dates:
+        return pd.DataFrame()
+    latest = read_history(root, columns=(column,), start=dates[-1])
+    names = list(dict.fromkeys(top_k(latest.dropna(subset=[column]), column, n)["name"]))
+    history = read_history(root, names, (column,), last=last)
+    return history.pivot_table(index=PARTITION_KEY, columns="name", values=column, aggfunc="last")[names]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Save and read dated snapshots of the SteamDB export.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    save = commands.add_parser("save", help="parse a CSV export and store it as a snapshot")
+    save.add_argument("csv")
+    save.add_argument("--root", help="snapshot directory (default: next to the CSV)")
+    save.add_argument("--date", type=date.fromisoformat, help="snapshot date (default: the file's modification date)")
+
+    history = commands.add_parser("history", help="follower gain of the top games over recent snapshots")
+    history.add_argument("--root", required=True)
+    history.add_argument("--top", type=int, default=1000)
+    history.add_argument("--last", type=int, default=90)
+    history.add_argument("--column", default="followers_gain")
+    history.add_argument("--output", help="CSV file to write (default: print a summary)")
+    args = parser.parse_args()
+
+    if args.command == "save":
+        from data_loader import normalize, read_raw_csv
+
+        taken = args.date or datetime.fromtimestamp(os.path.getmtime(args.csv)).date()
+        target = save_snapshot(normalize(read_raw_csv(args.csv)), args.root or snapshot_dir(args.csv), taken)
+        print(target)
+        return 0
+
+    wide = top_history(args.root, args.top, args.last, args.column)
+    if args.output:
+        wide.to_csv(args.output)
+    else:
+        print(f"{len(wide)} snapshots x {wide.shape[1]} games")
+        print(wide.iloc[:, :5].tail())
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
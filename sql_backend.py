@@ -0,0 +1,188 @@
+# sql_backend.py
+#
+# Optional SQLite backend. The normalized dataset is copied once per file version into
+# a database next to the CSV (steamdb.csv -> steamdb.sqlite), indexed on followers_gain,
+# price_eur, rating_pct and release_date_parsed. The sql_* functions answer the same
+# questions as the compute_* functions in charts.py, but the filtering, ordering and
+# grouping run in SQLite and only the rows shown on screen come back to pandas.
+
+import contextlib
+import json
+import os
+import sqlite3
+
+import pandas as pd
+
+TABLE = "games"
+
+INDEXED_COLUMNS = ("followers_gain", "price_eur", "rating_pct", "release_date_parsed")
+
+# How the games table is stored; databases of another format (2: prices and ratings
+# copied from float64 columns) are rebuilt
+DATABASE_FORMAT = 2
+
+# Same cut-offs as cube.price_buckets / cube.rating_buckets
+PRICE_CAT = "CASE WHEN price_eur < 15 THEN 'Low' WHEN price_eur <= 40 THEN 'Mid' ELSE 'High' END"
+RATING_CAT = "CASE WHEN rating_pct >= 80 THEN 'Positive' WHEN rating_pct >= 50 THEN 'Mixed' ELSE 'Negative' END"
+
+
+def database_path(path: str) -> str:
+    """Path of the SQLite database kept next to a CSV: steamdb.csv -> steamdb.sqlite."""
+    return os.path.splitext(path)[0] + ".sqlite"
+
+
+def _connect(db: str) -> contextlib.closing:
+    return contextlib.closing(sqlite3.connect(db))
+
+
+def database_version(db: str) -> tuple[int, int] | None:
+    """Version of the CSV the database was built from, or None if there is no usable database."""
+    if not os.path.exists(db):
+        return None
+    try:
+        with _connect(db) as conn:
+            row = conn.execute("SELECT version FROM source WHERE format = ?", (DATABASE_FORMAT,)).fetchone()
+    except sqlite3.Error:
+        return None
+    return tuple(json.loads(row[0])) if row else None
+
+
+def build_database(df: pd.DataFrame, db: str, version: tuple[int, int]):
+    """
+    Write a normalized frame to `db` with indexes on INDEXED_COLUMNS, tagged with the
+    source CSV version. Built under a temporary name so readers never see a partial database.
+    """
+    tmp = db + ".tmp"
+    if os.path.exists(tmp):
+        os.remove(tmp)
+    with _connect(tmp) as conn:
+        df.to_sql(TABLE, conn, index=False, chunksize=50_000)
+        for column in INDEXED_COLUMNS:
+            if column in df:
+                conn.execute(f"CREATE INDEX idx_{column} ON {TABLE} ({column})")
+        conn.execute("CREATE TABLE source (version TEXT, format INTEGER)")
+        conn.execute("INSERT INTO source VALUES (?, ?)", (json.dumps(list(version)), DATABASE_FORMAT))
+        conn.commit()
+    os.replace(tmp, db)
+
+
+def row_count(db: str) -> int:
+    with _connect(db) as conn:
+        return conn.execute(f"SELECT COUNT(*) FROM {TABLE}").fetchone()[0]
+
+
+def _query(db: str, sql: str, params: tuple | dict = ()) -> pd.DataFrame:
+    with _connect(db) as conn:
+        df = pd.read_sql_query(sql, conn, params=params)
+    if "has_discount" in df:
+        df["has_discount"] = df["has_discount"].astype(bool)
+    return df
+
+
+def sql_price_vs_gain(db: str, top_n: int = 100) -> pd.DataFrame:
+    return _query(db, f"""
+        SELECT name, price, price_eur, followers_gain, discount FROM {TABLE}
+        WHERE price IS NOT NULL
+          AND price_eur IS NOT NULL AND followers_gain IS NOT NULL
+        ORDER BY followers_gain DESC, name
+        LIMIT ?
+    """, (top_n,))
+
+
+def sql_segmentation(db: str) -> pd.Series:
+    df = _query(db, f"""
+        SELECT {PRICE_CAT} AS price_cat, {RATING_CAT} AS rating_cat, AVG(followers_gain) AS followers_gain
+        FROM {TABLE}
+        WHERE price IS NOT NULL AND rating IS NOT NULL
+          AND price_eur IS NOT NULL AND followers_gain IS NOT NULL AND rating_pct IS NOT NULL
+        GROUP BY price_cat, rating_cat
+        ORDER BY price_cat, rating_cat
+    """)
+    return df.set_index(["price_cat", "rating_cat"])["followers_gain"]
+
+
+def sql_discount_rescue(db: str) -> pd.DataFrame:
+    return _query(db, f"""
+        SELECT name, followers_gain, rating, discount, has_discount FROM {TABLE}
+        WHERE rating IS NOT NULL
+          AND followers_gain IS NOT NULL AND rating_pct < 50
+        ORDER BY followers_gain DESC, name
+        LIMIT 100
+    """)
+
+
+def sql_value_analysis(db: str) -> pd.DataFrame:
+    return _query(db, f"""
+        SELECT name, followers_gain, price_eur, CAST(followers_gain AS REAL) / price_eur AS value_score FROM {TABLE}
+        WHERE price IS NOT NULL
+          AND followers_gain IS NOT NULL AND price_eur > 0
+        ORDER BY value_score DESC, name
+        LIMIT 10
+    """)
+
+
+def _bottom_top(db: str, select: str, where: str, column: str, k: int) -> tuple[pd.DataFrame, pd.DataFrame]:
+    # Same order and tie-break (name) as ranking.top_bottom_k
+    return tuple(
+        _query(db, f"SELECT {select} FROM {TABLE} WHERE {where} ORDER BY {column} {direction}, name LIMIT ?", (k,))
+        for direction in ("ASC", "DESC")
+    )
+
+
+def sql_over_under_rated(db: str) -> tuple[pd.DataFrame, pd.DataFrame]:
+    return _bottom_top(
+        db,
+        "name, followers_gain, rating_pct, CAST(followers_gain AS REAL) / rating_pct AS value_index",
+        "rating IS NOT NULL AND followers_gain IS NOT NULL AND rating_pct > 0",
+        "value_index",
+        5,
+    )
+
+
+def sql_unexpected_hits(db: str) -> tuple[pd.DataFrame, pd.DataFrame]:
+    return _bottom_top(
+        db,
+        "name, followers_gain AS followers_num, peak AS peak_num, CAST(peak AS REAL) / followers_gain AS peak_ratio",
+        "price IS NOT NULL AND peak IS NOT NULL AND followers_gain > 0 AND price_eur > 0",
+        "peak_ratio",
+        5,
+    )
+
+
+def _top_launches(db: str, today: pd.Timestamp | None) -> pd.DataFrame:
+    today = pd.to_datetime("today") if today is None else today
+    df = _query(db, f"""
+        SELECT name, followers_num, release_date, days_since_release,
+               CAST(followers_num AS REAL) / days_since_release AS launch_index
+        FROM (
+            SELECT name, followers_gain AS followers_num, release_date,
+                   CAST(julianday(:today) - julianday(release_date_parsed) AS INTEGER) AS days_since_release
+            FROM {TABLE}
+            WHERE release_date IS NOT NULL AND followers_gain IS NOT NULL
+              AND release_date_parsed < :today
+        )
+        WHERE days_since_release > 0
+        ORDER BY launch_index DESC, name
+        LIMIT 10
+    """, {"today": today.strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]})
+    df["days_since_release"] = df["days_since_release"].astype(float)
+    return df
+
+
+def sql_growth_potential(db: str, today: pd.Timestamp | None = None) -> pd.DataFrame:
+    return _top_launches(db, today)
+
+
+def sql_launch_efficiency(db: str, today: pd.Timestamp | None = None) -> pd.DataFrame:
+    return _top_launches(db, today)
+
+
+def sql_heatmap_rating_price(db: str) -> pd.DataFrame:
+    df = _query(db, f"""
+        SELECT {RATING_CAT} AS rating_cat, {PRICE_CAT} AS price_cat, AVG(peak) AS peak
+        FROM {TABLE}
+        WHERE price IS NOT NULL AND rating IS NOT NULL
+          AND price_eur IS NOT NULL AND rating_pct IS NOT NULL AND peak IS NOT NULL
+        GROUP BY rating_cat, price_cat
+    """)
+    return df.pivot(index="rating_cat", columns="price_cat", values="peak")
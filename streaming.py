@@ -0,0 +1,151 @@
+# streaming.py
+
+import os
+import pandas as pd
+import streamlit as st
+
+import perf
+from data_loader import MAIN_CSV_PATH, iter_raw_csv, normalize
+from charts import (
+    discount_flags,
+    render_discount_tables,
+    label_discount_boxplot,
+    render_segmentation,
+    value_scores,
+    render_value_analysis,
+    launch_indexes,
+    render_launch_efficiency,
+)
+from cube import PriceRatingCube
+from figures import show_figure
+from ranking import top_k
+from sketch import QuantileSketch
+
+# Rows read per chunk in streaming mode
+CHUNK_SIZE = 100_000
+
+# Rows kept per table when a full listing would not fit in memory
+TABLE_ROWS = 1_000
+
+
+class TopN:
+    """
+    Keep the n rows with the largest `key` seen so far.
+    Ties are broken by name (see ranking.top_k), so results do not depend on the chunk size.
+    """
+
+    def __init__(self, n: int, key: str):
+        self.n = n
+        self.key = key
+        self.rows = None
+        self.total = 0
+
+    def update(self, df: pd.DataFrame):
+        self.total += len(df)
+        best = top_k(df, self.key, self.n)
+        if self.rows is not None:
+            best = top_k(pd.concat([self.rows, best]), self.key, self.n)
+        self.rows = best
+
+    def result(self) -> pd.DataFrame:
+        return self.rows
+
+
+def _normalized_chunks(path: str):
+    chunks = iter(iter_raw_csv(path, CHUNK_SIZE))
+    while True:
+        with perf.stage("load"):
+            chunk = next(chunks, None)
+        if chunk is None:
+            return
+        with perf.stage("parse"):
+            chunk = normalize(chunk)
+        yield chunk
+
+
+def _chunks(path: str):
+    """Normalized chunks of a CSV, or None (with an error shown) if the file is missing."""
+    if not os.path.exists(path):
+        st.error(f"❌ CSV-файл не знайдено за шляхом: `{path}`")
+        return None
+    return _normalized_chunks(path)
+
+
+def stream_discount_analysis(path: str = MAIN_CSV_PATH):
+    chunks = _chunks(path)
+    if chunks is None:
+        return
+
+    columns = ["name", "followers_gain", "discount", "price"]
+    tops = {flag: TopN(TABLE_ROWS, "followers_gain") for flag in (False, True)}
+    gains = {flag: QuantileSketch() for flag in (False, True)}
+    for chunk in chunks:
+        chunk = discount_flags(chunk)
+        for flag in (False, True):
+            part = chunk[chunk["has_discount"] == flag]
+            tops[flag].update(part[columns])
+            gains[flag].update(part["followers_gain"])
+
+    st.caption(
+        f"Потоковий режим: показано топ-{TABLE_ROWS} з "
+        f"{tops[False].total} ігор без знижки та {tops[True].total} ігор зі знижкою."
+    )
+    render_discount_tables(tops[False].result(), tops[True].result())
+
+    # Boxplot without extreme outliers; the cut-off and box statistics come from the
+    # sketches, exact unless the gains have too many distinct values
+    q99 = gains[False].merged(gains[True]).quantile(0.99)
+    inside = {flag: gains[flag].below(q99) for flag in (False, True)}
+    stats = [
+        {**inside[flag].boxplot_stats(), "label": str(flag)}
+        for flag in (False, True)
+        if inside[flag].count
+    ]
+
+    def draw():
+        import matplotlib.pyplot as plt
+        import seaborn as sns
+
+        fig, ax = plt.subplots(figsize=(8, 5))
+        boxes = ax.bxp(stats, patch_artist=True)["boxes"]
+        for box, color in zip(boxes, sns.color_palette("autumn", len(boxes))):
+            box.set_facecolor(color)
+        label_discount_boxplot(ax)
+        return fig
+
+    show_figure("discount_analysis_streaming", draw, stats)
+
+
+def stream_segmentation(path: str = MAIN_CSV_PATH):
+    chunks = _chunks(path)
+    if chunks is None:
+        return
+
+    cube = PriceRatingCube()
+    for chunk in chunks:
+        cube.update(chunk)
+    render_segmentation(cube.means("followers_gain"))
+
+
+def stream_value_analysis(path: str = MAIN_CSV_PATH):
+    chunks = _chunks(path)
+    if chunks is None:
+        return
+
+    top10 = TopN(10, "value_score")
+    for chunk in chunks:
+        top10.update(value_scores(chunk))
+    render_value_analysis(top10.result())
+
+
+def stream_launch_efficiency(path: str = MAIN_CSV_PATH):
+    chunks = _chunks(path)
+    if chunks is None:
+        return
+
+    today = pd.to_datetime("today")
+    top10 = TopN(10, "launch_index")
+    for chunk in chunks:
+        top10.update(launch_indexes(chunk, today))
+    render_launch_efficiency(top10.result())
+
@@ -0,0 +1,108 @@
+# tables.py
+#
+# Tables paged on the server. The full frame stays in this process: it is sorted
+# here and only the visible page is serialized and sent to the browser, so a
+# table of hundreds of thousands of rows costs one page per rerun.
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+# Rows per page offered in the table controls; the first is the default
+PAGE_ROWS = (50, 100, 250, 1000)
+
+# Upper bound on the size of one page (in-memory bytes, strings included), which
+# bounds what st.dataframe serializes to Arrow; wide rows get fewer per page
+MAX_PAGE_BYTES = 2 * 2**20
+
+# Rows sampled to estimate the size of a row
+SIZE_SAMPLE_ROWS = 1_000
+
+# Sort option that keeps the frame's own order
+AS_IS = "—"
+
+
+def row_bytes(df: pd.DataFrame) -> float:
+    """Estimated in-memory size of one row, from the first SIZE_SAMPLE_ROWS rows."""
+    sample = df.iloc[:SIZE_SAMPLE_ROWS]
+    if sample.empty:
+        return 0.0
+    # A slice of a category column still reports its whole dictionary; measure the values
+    sample = sample.astype({c: object for c in sample.columns if isinstance(sample[c].dtype, pd.CategoricalDtype)})
+    return sample.memory_usage(index=False, deep=True).sum() / len(sample)
+
+
+def page_rows(df: pd.DataFrame, rows: int) -> int:
+    """`rows`, reduced if needed so a page stays within MAX_PAGE_BYTES (at least one row)."""
+    size = row_bytes(df)
+    if size <= 0:
+        return rows
+    return max(1, min(rows, int(MAX_PAGE_BYTES // size)))
+
+
+def sorted_page(df: pd.DataFrame, column: str | None, ascending: bool, start: int, rows: int) -> pd.DataFrame:
+    """
+    Rows start .. start + rows of `df` ordered by `column` (the frame's own order if None),
+    with missing values last and ties in frame order.
+
+    Numeric columns are not fully sorted: one partial selection (np.argpartition) finds
+    the first start + rows positions and only those are sorted. Other columns are sorted
+    in full.
+    """
+    end = min(start + rows, len(df))
+    if column is None or start >= end:
+        return df.iloc[start:end]
+    series = df[column]
+    if not (pd.api.types.is_numeric_dtype(series) or pd.api.types.is_bool_dtype(series)):
+        ordered = series.reset_index(drop=True).sort_values(ascending=ascending, kind="stable", na_position="last")
+        return df.iloc[ordered.index[start:end]]
+
+    keys = series.to_numpy(dtype=float, na_value=np.nan)
+    keys = np.where(np.isnan(keys), np.inf, keys if ascending else -keys)
+    if end >= len(keys):
+        head = np.arange(len(keys))
+    else:
+        # Everything below the cut-off value, then the first of the rows tied at it,
+        # so the page holds the same rows as a stable sort's
+        cutoff = np.partition(keys, end - 1)[end - 1]
+        below = np.flatnonzero(keys < cutoff)
+        head = np.concatenate([below, np.flatnonzero(keys == cutoff)[: end - len(below)]])
+    head = head[np.lexsort((head, keys[head]))]
+    return df.iloc[head[start:end]]
+
+
+def show_table(table: str, df: pd.DataFrame, sort: str | None = None, ascending: bool = False):
+    """
+    Show `df` one page at a time, with controls for the sort column and direction, page
+    size and page number, and the total row count. Sorting and paging run on the server;
+    the browser only receives the current page (at most MAX_PAGE_BYTES).
+
+    `table` is a name unique on the page (it keys the widgets); `sort` and `ascending`
+    are the initial order, None for the frame's own order.
+    """
+    total = len(df)
+    if total == 0:
+        st.caption("Немає рядків.")
+        return
+
+    options = [AS_IS, *df.columns]
+    sort_col, order_col, size_col, page_col = st.columns([3, 2, 2, 2])
+    column = sort_col.selectbox(
+        "Сортувати за", options, index=options.index(sort) if sort in options else 0, key=f"{table}_sort"
+    )
+    ascending = order_col.toggle("За зростанням", value=ascending, key=f"{table}_ascending")
+    requested = size_col.selectbox("Рядків на сторінці", PAGE_ROWS, key=f"{table}_rows")
+    rows = page_rows(df, requested)
+    pages = -(-total // rows)
+    # A larger page size leaves fewer pages than the one last shown
+    if st.session_state.get(f"{table}_page", 1) > pages:
+        st.session_state[f"{table}_page"] = pages
+    page = page_col.number_input("Сторінка", min_value=1, max_value=pages, key=f"{table}_page")
+
+    start = (int(page) - 1) * rows
+    view = sorted_page(df, None if column == AS_IS else column, ascending, start, rows)
+    st.dataframe(view, hide_index=True)
+    note = f"Рядки {start + 1}–{start + len(view)} з {total:,}, сторінка {int(page)} з {pages:,}"
+    if rows < requested:
+        note += f" (по {rows} рядків: обмеження розміру сторінки)"
+    st.caption(note)
@@ -0,0 +1,40 @@
+# tests/test_compaction.py
+#
+# compact() shrinks storage without changing the values analyses compute or show.
+
+import numpy as np
+import pandas as pd
+
+import charts
+from compaction import compact
+from data_loader import normalize
+
+
+def frame() -> pd.DataFrame:
+    return normalize(pd.DataFrame({
+        "name": ["A", "B", "C", "D"],
+        "followers": ["35,731+", "12+", None, "7,000+"],
+        "price": ["€0,99", "€19,99", "Free", "€4,79"],
+        "rating": ["85.12%", "40.00%", "99.51%", None],
+        "owners": ["1,234", None, "50", "77"],
+    }))
+
+
+def test_compact_dtypes():
+    df = compact(frame())
+    assert "followers" not in df and "owners" not in df
+    assert df["followers_gain"].dtype == np.float32 and df["peak"].dtype == np.float32
+    assert df["price_eur"].dtype == np.float64 and df["rating_pct"].dtype == np.float64
+    assert isinstance(df["price"].dtype, pd.CategoricalDtype)
+    pd.testing.assert_frame_equal(compact(df), df)
+
+
+def test_compacted_ratios_match_float64():
+    full, df = frame(), compact(frame())
+    expected = charts.compute_value_analysis(full)
+    result = charts.compute_value_analysis(df)
+    assert result["price_eur"].tolist() == [0.99, 4.79, 19.99]
+    assert result["value_score"].dtype == np.float64
+    pd.testing.assert_series_equal(result["value_score"], expected["value_score"])
+    for table in (*charts.compute_over_under_rated(df), *charts.compute_unexpected_hits(df)):
+        assert np.float32 not in set(table.dtypes)
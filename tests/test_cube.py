@@ -0,0 +1,92 @@
+# tests/test_cube.py
+#
+# PriceRatingCube gives the per-cell aggregates and quantiles of a groupby on the
+# price and rating categories, whether built in one pass, by chunk or by merging.
+
+import functools
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from benchmarks.synthetic import generate
+from charts import discount_mask
+from compaction import compact
+from cube import MEASURES, PriceRatingCube
+from data_loader import normalize
+
+
+def price_cat(p):
+    if p < 15: return "Low"
+    if p <= 40: return "Mid"
+    return "High"
+
+
+def rating_cat(r):
+    if r >= 80: return "Positive"
+    if r >= 50: return "Mixed"
+    return "Negative"
+
+
+@pytest.fixture(scope="module")
+def df() -> pd.DataFrame:
+    return compact(normalize(generate(6_000, seed=5)))
+
+
+@pytest.fixture(scope="module")
+def grouped(df) -> pd.DataFrame:
+    keyed = df.dropna(subset=["price", "rating", "price_eur", "rating_pct"])
+    return pd.DataFrame({
+        "price_cat": keyed["price_eur"].map(price_cat),
+        "rating_cat": keyed["rating_pct"].map(rating_cat),
+        "discounted": discount_mask(keyed).astype(bool),
+        **{m: keyed[m].astype(float) for m in MEASURES},
+    })
+
+
+def cubes(df: pd.DataFrame) -> list[PriceRatingCube]:
+    chunked = PriceRatingCube()
+    for start in range(0, len(df), 1_700):
+        chunked.update(df.iloc[start:start + 1_700])
+    parts = [PriceRatingCube.build(df.iloc[rows]) for rows in np.array_split(np.arange(len(df)), 4)]
+    return [PriceRatingCube.build(df), chunked, functools.reduce(PriceRatingCube.merged, parts)]
+
+
+@pytest.mark.parametrize("measure", MEASURES)
+@pytest.mark.parametrize("discount", [None, False, True])
+def test_cells_match_groupby(df, grouped, measure, discount):
+    rows = grouped if discount is None else grouped[grouped["discounted"] == discount]
+    expected = (
+        rows.dropna(subset=[measure])
+        .groupby(["price_cat", "rating_cat"])[measure]
+        .agg(["count", "sum", "min", "max", "mean"])
+    )
+    for cube in cubes(df):
+        pd.testing.assert_frame_equal(cube.cells(measure, discount), expected, check_dtype=False)
+        pd.testing.assert_series_equal(cube.means(measure, discount), expected["mean"].rename(measure))
+
+
+@pytest.mark.parametrize("measure", MEASURES)
+def test_quantiles_match_groupby(df, grouped, measure):
+    selections = [
+        (None, None, None), ("Low", None, None), (None, "Positive", None), ("Mid", "Mixed", True),
+        ("High", None, False), (None, None, True),
+    ]
+    for cube in cubes(df):
+        for price, rating, discount in selections:
+            rows = grouped
+            if price is not None:
+                rows = rows[rows["price_cat"] == price]
+            if rating is not None:
+                rows = rows[rows["rating_cat"] == rating]
+            if discount is not None:
+                rows = rows[rows["discounted"] == discount]
+            for q in (0, 0.1, 0.5, 0.9, 1):
+                expected = rows[measure].quantile(q)
+                assert cube.quantile(measure, q, price, rating, discount) == pytest.approx(expected, nan_ok=True)
+
+
+def test_empty_cube():
+    cube = PriceRatingCube()
+    assert cube.cells("peak").empty
+    assert np.isnan(cube.quantile("peak", 0.5))
@@ -0,0 +1,162 @@
+# tests/test_data_loader.py
+#
+# Splitting a CSV on record boundaries for the parallel parse, and IncrementalCSV's
+# handling of appended and rewritten files.
+
+import io
+
+import pandas as pd
+import pytest
+
+import data_loader
+from benchmarks.synthetic import generate
+from compaction import compact
+from data_loader import (
+    CSV_DTYPES, IncrementalCSV, file_version, normalize, read_normalized, read_normalized_parallel, read_raw_csv,
+    sidecar_path, split_csv, write_sidecar,
+)
+
+
+def quoted_csv(path, rows: int, start: int = 0) -> str | None:
+    # `rows` synthetic games written to `path` (returned as text if it is None). Every
+    # third name spans lines and every fifth has quotes, so a naive newline split lands
+    # inside quoted fields
+    df = generate(rows, seed=start, start=start)
+    df["name"] = [
+        f'{name}\n"part {i}"' if i % 3 == 0 else f'{name} ""x""' if i % 5 == 0 else name
+        for i, name in enumerate(df["name"], start)
+    ]
+    return df.to_csv(path, index=False)
+
+
+def assert_same_rows(actual: pd.DataFrame, expected: pd.DataFrame):
+    pd.testing.assert_frame_equal(
+        actual.reset_index(drop=True), expected.reset_index(drop=True), check_dtype=False, check_categorical=False,
+    )
+
+
+@pytest.mark.parametrize("parts", [1, 2, 3, 7, 16])
+@pytest.mark.parametrize("scan_bytes", [5, 4096])
+def test_split_csv_keeps_quoted_newlines(tmp_path, monkeypatch, parts, scan_bytes):
+    # Small scan blocks put block boundaries inside quoted fields too
+    monkeypatch.setattr(data_loader, "SPLIT_SCAN_BYTES", scan_bytes)
+    path = tmp_path / "games.csv"
+    quoted_csv(path, 300)
+    data = path.read_bytes()
+
+    header_end, ranges = split_csv(str(path), parts)
+    assert ranges[0][0] == header_end and ranges[-1][1] == len(data)
+    assert all(end == start for (_, end), (start, _) in zip(ranges, ranges[1:]))
+    assert len(ranges) <= parts
+
+    chunks = [
+        pd.read_csv(io.BytesIO(data[:header_end] + data[start:end]), usecols=lambda c: c in CSV_DTYPES, dtype=CSV_DTYPES)
+        for start, end in ranges
+    ]
+    assert_same_rows(pd.concat(chunks), read_raw_csv(str(path)))
+
+
+def test_parallel_parse_matches_single_read(tmp_path):
+    path = tmp_path / "games.csv"
+    quoted_csv(path, 2_000)
+    assert_same_rows(read_normalized_parallel(str(path), workers=3), normalize(read_raw_csv(str(path))))
+
+
+def expected_frame(path) -> pd.DataFrame:
+    return compact(normalize(read_raw_csv(str(path))))
+
+
+def test_incremental_csv_parses_appended_rows(tmp_path):
+    path = tmp_path / "games.csv"
+    quoted_csv(path, 500)
+    csv = IncrementalCSV(str(path))
+    csv.refresh()
+    assert csv.generation == 1 and len(csv.frame) == 500
+
+    # Appended rows, the last one (a single line) still being written
+    complete = quoted_csv(None, 99, start=500).split("\n", 1)[1]
+    partial = quoted_csv(None, 1, start=599).split("\n", 1)[1]
+    with open(path, "a") as f:
+        f.write(complete + partial[:5])
+    csv.refresh()
+    assert csv.generation == 1 and csv.rows == len(csv.frame) == 599
+
+    with open(path, "a") as f:
+        f.write(partial[5:])
+    version = csv.refresh()
+    assert csv.generation == 1 and csv.generation_of(version) == 1
+    assert_same_rows(csv.frame, expected_frame(path))
+
+
+def test_incremental_csv_rebuilds_rewritten_file(tmp_path):
+    path = tmp_path / "games.csv"
+    quoted_csv(path, 500)
+    csv = IncrementalCSV(str(path))
+    first = csv.refresh()
+
+    # Longer than before, so it looks like an append by size alone
+    quoted_csv(path, 600, start=1_000)
+    version = csv.refresh()
+    assert csv.generation == 2
+    assert csv.generation_of(first) == 1 and csv.generation_of(version) == 2
+    assert_same_rows(csv.frame, expected_frame(path))
+
+    # Shorter than the part already parsed
+    quoted_csv(path, 50, start=2_000)
+    csv.refresh()
+    assert csv.generation == 3
+    assert_same_rows(csv.frame, expected_frame(path))
+
+
+def test_incremental_csv_skips_sidecar_of_partial_row(tmp_path):
+    # A full load wrote the sidecar while the scraper was halfway through "B"
+    path = tmp_path / "games.csv"
+    path.write_text("name,followers,price\nA,1000+,€1\nB,5", encoding="utf-8")
+    write_sidecar(expected_frame(path), sidecar_path(str(path)), file_version(str(path)))
+    csv = IncrementalCSV(str(path))
+    csv.refresh()
+    assert csv.frame["name"].tolist() == ["A"]
+
+    with open(path, "a", encoding="utf-8") as f:
+        f.write("00+,€2\n")
+    csv.refresh()
+    assert csv.frame["name"].tolist() == ["A", "B"]
+    assert csv.frame["followers_gain"].tolist() == [1000, 500]
+
+
+def test_incremental_csv_waits_for_multiline_record(tmp_path):
+    path = tmp_path / "games.csv"
+    quoted_csv(path, 10)
+    # A new game whose quoted name spans lines, written up to and past its first line break
+    record = quoted_csv(None, 1, start=30).split("\n", 1)[1]
+    first_break = record.index("\n")
+    with open(path, "a") as f:
+        f.write(record[:first_break + 1])
+    csv = IncrementalCSV(str(path))
+    csv.refresh()
+    assert len(csv.frame) == 10
+
+    with open(path, "a") as f:
+        f.write(record[first_break + 1:-3])
+    csv.refresh()
+    assert csv.generation == 1 and len(csv.frame) == 10
+
+    with open(path, "a") as f:
+        f.write(record[-3:])
+    csv.refresh()
+    assert csv.generation == 1 and len(csv.frame) == 11
+    assert_same_rows(csv.frame, expected_frame(path))
+
+
+def test_read_normalized_projects_the_sidecar(tmp_path, monkeypatch):
+    path = str(tmp_path / "games.csv")
+    quoted_csv(path, 200)
+    version = file_version(path)
+    full = read_normalized(path, version)
+
+    # Once the sidecar is written, a column subset is read from it alone
+    monkeypatch.setattr(data_loader, "shared_dataset", None)
+    columns = ("name", "price_eur", "release_date", "not_a_column")
+    projected = read_normalized(path, version, columns)
+    assert list(projected.columns) == ["name", "price_eur", "release_date"]
+    pd.testing.assert_frame_equal(projected, full[list(projected.columns)])
@@ -0,0 +1,58 @@
+# tests/test_filters.py
+#
+# FilterIndex.select keeps the same rows as comparing every row with the filters.
+
+from datetime import date
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from benchmarks.synthetic import generate
+from charts import discount_mask
+from compaction import compact
+from data_loader import normalize
+from filters import FilterIndex, Filters
+
+
+@pytest.fixture(scope="module")
+def df() -> pd.DataFrame:
+    return compact(normalize(generate(5_000, seed=11)))
+
+
+def masked(df: pd.DataFrame, filters: Filters) -> np.ndarray:
+    keep = pd.Series(True, index=df.index)
+    if filters.price is not None:
+        keep &= df["price_eur"].between(*filters.price)
+    if filters.rating is not None:
+        keep &= df["rating_pct"].between(*filters.rating)
+    if filters.released is not None:
+        low, high = (pd.Timestamp(d) for d in filters.released)
+        keep &= df["release_date_parsed"].between(low, high)
+    if filters.discount is not None:
+        keep &= discount_mask(df) == filters.discount
+    return np.flatnonzero(keep.to_numpy())
+
+
+@pytest.mark.parametrize("filters", [
+    Filters(price=(0.0, 0.0)),
+    Filters(price=(4.99, 19.99)),
+    Filters(rating=(50.0, 80.0)),
+    Filters(released=(date(2015, 1, 1), date(2019, 12, 31))),
+    Filters(discount=True),
+    Filters(discount=False),
+    Filters(price=(10.0, 60.0), rating=(70.0, 100.0), discount=True),
+    Filters(price=(10.0, 60.0), rating=(70.0, 100.0), released=(date(2020, 1, 1), date(2030, 1, 1))),
+    Filters(price=(60.0, 10.0)),
+])
+def test_select_matches_row_comparison(df, filters):
+    np.testing.assert_array_equal(FilterIndex(df).select(filters), masked(df, filters))
+
+
+def test_no_filter_and_bounds(df):
+    index = FilterIndex(df)
+    assert index.select(Filters()) is None
+    # The full range offered by the sidebar keeps every row with a value
+    for field, column in (("price", "price_eur"), ("rating", "rating_pct"), ("released", "release_date_parsed")):
+        rows = index.select(Filters(**{field: index.bounds(field)}))
+        np.testing.assert_array_equal(rows, np.flatnonzero(df[column].notna().to_numpy()))
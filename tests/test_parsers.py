@@ -0,0 +1,65 @@
+# tests/test_parsers.py
+#
+# The vectorized column parsers must give the scalar parsers' results, on synthetic
+# scraper output and on hand-picked edge cases, for text and categorical columns.
+#
+#     uv run pytest -q
+
+import pandas as pd
+import pytest
+
+from benchmarks.synthetic import generate
+from parsers import (
+    parse_followers, parse_followers_series,
+    parse_price, parse_price_series,
+    parse_rating, parse_rating_series,
+    parse_discount, parse_discount_series,
+    parse_peak, parse_peak_series,
+    parse_release_date, parse_release_date_series,
+)
+
+EDGE_CASES = [
+    "", " ", "+", "%", "1,234+", "-5", "12,345", "Free", " free ", "€19,99", "€ 1,5", "€abc",
+    "85%", "85,5%", "1.5%", "-20%", "20%", "-20% then -10%", None, float("nan"), 42,
+]
+
+DATE_EDGE_CASES = [
+    "12 March 2020", "12 Mar, 2020", "2020-03-12", "Mar 12, 2020", "March 12, 2020",
+    "March 2020", "Mar 2020", "2020", "Coming soon", "To be announced", "Q3 2026", "", None,
+]
+
+PARSERS = [
+    (parse_followers, parse_followers_series, "followers"),
+    (parse_price, parse_price_series, "price"),
+    (parse_price, parse_price_series, "discount"),
+    (parse_rating, parse_rating_series, "rating"),
+    (parse_discount, parse_discount_series, "discount"),
+    (parse_discount, parse_discount_series, "price"),
+    (parse_peak, parse_peak_series, "owners"),
+]
+
+
+def column(name: str, edge_cases: list, dtype: str) -> pd.Series:
+    values = pd.concat([generate(2_000, seed=3)[name], pd.Series(edge_cases, dtype=object)], ignore_index=True)
+    return values.astype(dtype)
+
+
+@pytest.mark.parametrize("dtype", ["object", "category"])
+@pytest.mark.parametrize("scalar, series, name", PARSERS)
+def test_series_parser_matches_scalar(scalar, series, name, dtype):
+    values = column(name, EDGE_CASES, dtype)
+    expected = pd.Series([scalar(v) for v in values], index=values.index, dtype=object)
+    pd.testing.assert_series_equal(series(values).astype(float), expected.astype(float), check_names=False)
+
+
+@pytest.mark.parametrize("dtype", ["object", "category"])
+def test_release_date_series_matches_scalar(dtype):
+    values = column("release_date", DATE_EDGE_CASES, dtype)
+    expected = pd.Series([parse_release_date(v) for v in values], index=values.index, dtype="datetime64[ns]")
+    pd.testing.assert_series_equal(parse_release_date_series(values), expected, check_names=False)
+
+
+def test_non_text_columns():
+    numbers = pd.Series([1.0, float("nan")])
+    assert parse_followers_series(numbers).isna().all()
+    assert not parse_discount_series(numbers).any()
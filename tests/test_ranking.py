@@ -0,0 +1,74 @@
+# tests/test_ranking.py
+#
+# Partial-selection rankings and RankingStore give the rows and order of a full sort of
+# the metric, then the tie breaker, also for the rows a filter keeps.
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from ranking import RankingStore, top_bottom_k, top_k
+
+
+def games(n: int = 500, seed: int = 0) -> pd.DataFrame:
+    # Few distinct gains, so ties across the cut-offs are common; some gains missing
+    rng = np.random.default_rng(seed)
+    gain = rng.integers(0, 40, n).astype(float)
+    gain[rng.random(n) < 0.1] = np.nan
+    names = [f"game {i:04d}" for i in rng.permutation(n)]
+    return pd.DataFrame({"name": names, "followers_gain": gain, "price_eur": rng.random(n) * 60})
+
+
+def sorted_reference(df: pd.DataFrame, metric: pd.Series, ascending: bool, k: int) -> pd.DataFrame:
+    rows = df.assign(**{metric.name: metric})[metric.notna()]
+    return rows.sort_values([metric.name, "name"], ascending=[ascending, True], kind="stable").head(k)
+
+
+@pytest.mark.parametrize("k", [0, 1, 5, 37, 449, 500, 1000])
+def test_top_bottom_k_matches_full_sort(k):
+    df = games()
+    bottom, top = top_bottom_k(df, "followers_gain", k)
+    pd.testing.assert_frame_equal(bottom, sorted_reference(df, df["followers_gain"], True, k))
+    pd.testing.assert_frame_equal(top, sorted_reference(df, df["followers_gain"], False, k))
+    pd.testing.assert_frame_equal(top_k(df, "followers_gain", k), top)
+
+
+def test_derived_metric_is_added_and_frame_untouched():
+    df = games()
+    before = df.copy()
+    ratio = (df["followers_gain"] / df["price_eur"]).where(df["price_eur"] > 30).rename("ratio")
+    bottom, top = top_bottom_k(df, ratio, 10)
+    pd.testing.assert_frame_equal(bottom, sorted_reference(df, ratio, True, 10))
+    pd.testing.assert_frame_equal(top, sorted_reference(df, ratio, False, 10))
+    pd.testing.assert_frame_equal(df, before)
+
+
+def store(df: pd.DataFrame) -> RankingStore:
+    return RankingStore(df, {
+        "followers_gain": lambda df: df["followers_gain"],
+        "value": lambda df: (df["followers_gain"] / df["price_eur"]).where(df["price_eur"] > 5),
+    })
+
+
+@pytest.mark.parametrize("k", [None, 0, 10, 1000])
+def test_store_top_matches_top_k(k):
+    df = games()
+    rankings = store(df)
+    where = (df["price_eur"] < 40).to_numpy()
+    for metric in ("followers_gain", "value"):
+        values = rankings.values(metric).where(where)
+        expected = top_k(df, values, len(df) if k is None else k)
+        pd.testing.assert_frame_equal(rankings.top(df, metric, k, where=where), expected)
+
+
+def test_restricted_matches_store_of_rows():
+    df = games(2_000, seed=1)
+    rows = np.flatnonzero((df["price_eur"] > 20).to_numpy())
+    restricted, fresh = store(df).restricted(rows), store(df.iloc[rows])
+    subset = df.iloc[rows]
+    where = (subset["followers_gain"] % 2 == 0).to_numpy()
+    for metric in ("followers_gain", "value"):
+        pd.testing.assert_series_equal(restricted.values(metric), fresh.values(metric))
+        np.testing.assert_array_equal(restricted.order(metric), fresh.order(metric))
+        pd.testing.assert_frame_equal(restricted.top(subset, metric, 25, where=where),
+                                      fresh.top(subset, metric, 25, where=where))
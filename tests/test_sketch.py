@@ -0,0 +1,78 @@
+# tests/test_sketch.py
+#
+# QuantileSketch is exact while it counts distinct values, and stays within its rank
+# error bound once compacted, whether filled in one batch, by chunk or by merging.
+
+import functools
+
+import numpy as np
+import pandas as pd
+import pytest
+from matplotlib import cbook
+
+from sketch import QuantileSketch
+
+QUANTILES = [0, 0.01, 0.25, 0.5, 0.75, 0.9, 0.99, 0.999, 1]
+
+# Rank error allowed for the compacted sketch, as a share of the count (about 0.2% is
+# expected at the default K)
+RANK_ERROR = 0.005
+
+
+def chunked(values: np.ndarray, size: int) -> QuantileSketch:
+    sketch = QuantileSketch()
+    for i in range(0, len(values), size):
+        sketch.update(values[i:i + size])
+    return sketch
+
+
+def merged(values: np.ndarray, parts: int) -> QuantileSketch:
+    sketches = []
+    for part in np.array_split(values, parts):
+        sketches.append(QuantileSketch())
+        sketches[-1].update(part)
+    return functools.reduce(QuantileSketch.merged, sketches)
+
+
+def fillings(values: np.ndarray) -> list[QuantileSketch]:
+    return [chunked(values, len(values)), chunked(values, 7_000), merged(values, 13)]
+
+
+def test_exact_while_values_are_few():
+    # Heavy-tailed integer counts, like follower gains, with NaN mixed in
+    rng = np.random.default_rng(0)
+    values = np.floor(rng.lognormal(5, 2, 200_000))
+    values[::97] = np.nan
+    series = pd.Series(values)
+    for sketch in fillings(values):
+        assert sketch.exact
+        assert sketch.count == series.count() and sketch.sum == pytest.approx(series.sum())
+        for q in QUANTILES:
+            assert sketch.quantile(q) == pytest.approx(series.quantile(q))
+        cut = series.quantile(0.99)
+        below = sketch.below(cut)
+        assert below.count == (series < cut).sum() and below.sum == pytest.approx(series[series < cut].sum())
+
+
+def test_boxplot_stats_match_matplotlib():
+    values = np.floor(np.random.default_rng(1).lognormal(3, 1, 10_000))
+    sketch = chunked(values, 1_000)
+    expected = cbook.boxplot_stats(values)[0]
+    stats = sketch.boxplot_stats()
+    for key in ("med", "q1", "q3", "whislo", "whishi", "mean"):
+        assert stats[key] == pytest.approx(expected[key])
+    np.testing.assert_array_equal(stats["fliers"], np.unique(expected["fliers"]))
+
+
+def test_rank_error_once_compacted():
+    values = np.random.default_rng(2).lognormal(5, 2, 500_000)
+    ordered = np.sort(values)
+    for sketch in fillings(values):
+        assert not sketch.exact
+        assert sketch.count == len(values)
+        assert (sketch.min, sketch.max) == (ordered[0], ordered[-1])
+        for q in QUANTILES:
+            # Distance from the q-th rank to the ranks the estimate occupies
+            estimate = sketch.quantile(q)
+            low, high = np.searchsorted(ordered, estimate, "left"), np.searchsorted(ordered, estimate, "right")
+            assert max(low - q * len(values), q * len(values) - high, 0) <= RANK_ERROR * len(values)
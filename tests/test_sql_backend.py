@@ -0,0 +1,68 @@
+# tests/test_sql_backend.py
+#
+# Every sql_* query gives the rows, order and values of the compute_* function it
+# stands in for, in the columns it returns (those the render step shows). Storage
+# types may differ: SQLite returns text for category columns and integers for whole
+# counts.
+
+import inspect
+
+import pandas as pd
+import pytest
+
+from benchmarks.synthetic import generate
+from compaction import compact
+from data_loader import normalize
+from registry import REGISTRY
+from sql_backend import build_database, database_version, row_count
+
+TODAY = pd.Timestamp("2025-06-01 12:00")
+
+
+@pytest.fixture(scope="module")
+def df() -> pd.DataFrame:
+    return compact(normalize(generate(5_000, seed=7)))
+
+
+@pytest.fixture(scope="module")
+def db(df, tmp_path_factory) -> str:
+    db = str(tmp_path_factory.mktemp("sql") / "steamdb.sqlite")
+    build_database(df, db, (1, 2))
+    return db
+
+
+def values(s: pd.Series) -> pd.Series:
+    if pd.api.types.is_numeric_dtype(s) or pd.api.types.is_bool_dtype(s):
+        return s.astype(float)
+    return s.astype(object).where(s.notna(), None)
+
+
+def assert_same(result, expected):
+    if isinstance(expected, tuple):
+        assert len(result) == len(expected)
+        for r, e in zip(result, expected):
+            assert_same(r, e)
+    elif isinstance(expected, pd.Series):
+        pd.testing.assert_series_equal(values(result), values(expected), check_index_type=False)
+    else:
+        # Row labels are compared only where they are categories (the heatmap's ratings)
+        drop = expected.index.names == [None]
+        result, expected = result.reset_index(drop=drop), expected.reset_index(drop=drop)
+        assert set(result.columns) <= set(expected.columns)
+        for column in result:
+            pd.testing.assert_series_equal(values(result[column]), values(expected[column]))
+
+
+@pytest.mark.parametrize("analysis", [a for a in REGISTRY if a.sql is not None], ids=lambda a: a.sql.__name__)
+def test_sql_matches_compute(df, db, analysis):
+    params = dict(analysis.defaults)
+    if "today" in inspect.signature(analysis.sql).parameters:
+        params["today"] = TODAY
+    expected = analysis.compute(df, **params)
+    assert_same(analysis.sql(db, **params), expected)
+
+
+def test_database_version(df, db, tmp_path):
+    assert database_version(db) == (1, 2)
+    assert row_count(db) == len(df)
+    assert database_version(str(tmp_path / "missing.sqlite")) is None
@@ -0,0 +1,44 @@
+# tests/test_tables.py
+#
+# sorted_page gives the page a full stable sort would, with missing values last.
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from tables import sorted_page
+
+
+def frame(n: int = 1_000, seed: int = 0) -> pd.DataFrame:
+    # Few distinct values, so pages often start and end inside a run of ties
+    rng = np.random.default_rng(seed)
+    gain = rng.integers(-20, 20, n).astype(float)
+    gain[rng.random(n) < 0.1] = np.nan
+    names = pd.Series([f"game {i % 97:02d}" for i in rng.permutation(n)])
+    names[rng.random(n) < 0.05] = None
+    return pd.DataFrame({
+        "name": names,
+        "followers_gain": gain,
+        "peak": rng.integers(0, 10, n).astype(np.int32),
+        "discounted": rng.random(n) < 0.3,
+        "genre": pd.Categorical(rng.choice(["RPG", "Action", "Indie"], n)),
+    }, index=rng.permutation(n) + 10_000)
+
+
+def reference(df: pd.DataFrame, column: str, ascending: bool, start: int, rows: int) -> pd.DataFrame:
+    ordered = df.sort_values(column, ascending=ascending, kind="stable", na_position="last")
+    return ordered.iloc[start:start + rows]
+
+
+@pytest.mark.parametrize("column", ["followers_gain", "peak", "discounted", "name", "genre"])
+@pytest.mark.parametrize("ascending", [True, False])
+@pytest.mark.parametrize("start, rows", [(0, 50), (0, 1), (37, 100), (450, 250), (900, 250), (1_000, 50), (0, 5_000)])
+def test_sorted_page_matches_full_sort(column, ascending, start, rows):
+    df = frame()
+    pd.testing.assert_frame_equal(sorted_page(df, column, ascending, start, rows),
+                                  reference(df, column, ascending, start, rows))
+
+
+def test_unsorted_page():
+    df = frame()
+    pd.testing.assert_frame_equal(sorted_page(df, None, True, 100, 50), df.iloc[100:150])